@@ -28,6 +28,7 @@ class NitroSession:
     :ivar session: Underlying `requests.Session` object. 
     :ivar config: `NitroConfig` object.  
     :ivar login_info: Login user infos as returned by ``login`` API method.
+    :ivar pool_size: Number of HTTP connections kept alive with the ESM.
     """
 
     def __init__(self, config=None):
@@ -67,7 +68,8 @@ class NitroSession:
             self.api_v = 0
             self.logged_in = False
             self.login_info = dict()
-            self.session = requests.Session()
+            self.pool_size = self.DEFAULT_POOL_SIZE
+            self.session = self._new_session()
 
             try:
                 requests.packages.urllib3.disable_warnings(
@@ -83,6 +85,9 @@ class NitroSession:
     BASE_URL_PRIV = "https://{}/ess/"
     """Private API base URL: ``https://{}/ess/``"""
 
+    DEFAULT_POOL_SIZE = 10
+    """Minimum number of HTTP connections kept alive with the ESM: ``10``"""
+
     __initiated__ = False
     """
     Weither the session has been intaciated. It's supposed to be a singleton.
@@ -551,6 +556,33 @@ class NitroSession:
     def __str__(self):
         return repr(self.__unique_state__)
 
+    def _new_session(self):
+        """
+        Private method. Returns a new `requests.Session` object which keeps up to `pool_size` HTTP connections alive.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _ensure_pool_size(self, pool_size):
+        """
+        Private method. Grow the HTTP connection pool so ``pool_size`` concurrent requests can re-use their connections
+        instead of doing new TLS handshakes. Called before loading queries asynchronously.
+
+        The pool only grows, the previous adapter is closed so its connections are not leaked.
+        """
+        if pool_size > self.pool_size:
+            self.pool_size = pool_size
+            previous = self.session.get_adapter("https://")
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            self.session.mount("https://", adapter)
+            previous.close()
+
     def login(self, retry=1):
         """
         Authentication is done lazily upon the first call to `msiempy.core.session.NitroSession.request` method, but you can still do it manually by calling this method.
@@ -617,7 +649,7 @@ class NitroSession:
         self.request("logout", http="delete")
         self.logged_in = False
         self.login_info = dict()
-        self.session = requests.Session()
+        self.session = self._new_session()
         self.user_tz_id = None
 
     def api_request(
@@ -4,6 +4,7 @@
 
 import base64
 import re
+import sys
 from functools import wraps
 from datetime import datetime, timedelta
 import dateutil.parser
@@ -258,7 +259,26 @@ def convert_to_time_obj(time_str):
     return dateutil.parser.parse(time_str)
 
 
-def parse_query_result(columns, rows):
+def parse_query_columns(columns):
+    """
+    Parse the query result columns into the tuple of column names used to build the events. 
+
+    The columns are the same for all the pages of a query result, 
+    so the returned tuple can be re-used with `parse_query_result`.
+    The names are interned, all the parsed events share the same key objects.
+
+    Arguments:
+        - `columns` (`list[dict]`): Returned by the SIEM. Exemple:: 
+        
+            [{'name': 'Alert.LastTime'}, {'name': 'Rule.msg'}, {'name': 'Alert.DstIP'}, {'name': 'Alert.IPSIDAlertID'}]
+
+    Returns :
+        `tuple[str]`
+    """
+    return tuple(sys.intern(column["name"]) for column in columns)
+
+
+def parse_query_result(columns, rows, names=None):
     """
     Parse the query results into a list of dict 
     
@@ -274,6 +294,9 @@ def parse_query_result(columns, rows):
                 {'values': ['09/22/2020 15:51:14', 'Postfix Lost connection from host', '::', '144116287604260864|547122']}
             ]
 
+        - `names` (`tuple[str]`): Pre-parsed column names as returned by `parse_query_columns`. 
+            The `columns` are not parsed again if specified.
+
     Returns :
         `list[dict]`
 
@@ -292,15 +315,10 @@ def parse_query_result(columns, rows):
         ]
 
     """
-    events = list()
-    for row in rows:
-        event = dict()
-        for i in range(len(columns)):
-            event.update({columns[i]["name"]: row["values"][i]})
-
-        events.append(event)
+    if names is None:
+        names = parse_query_columns(columns)
 
-    return events
+    return [dict(zip(names, row["values"])) for row in rows]
 
 
 def format_fields_for_query(fields):
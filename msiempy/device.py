@@ -803,10 +803,7 @@ class DevTree(NitroList):
 
     def _insert_zone_ids(self, zone_map, devtree):
         for device in devtree:
-            if device["zone_name"] in zone_map.keys():
-                device["zone_id"] = zone_map.get(device["zone_name"])
-            else:
-                device["zone_id"] = "0"
+            device["zone_id"] = zone_map.get(device["zone_name"], "0")
         return devtree
 
     # Unused method
@@ -5,21 +5,38 @@ Base object:
 """
 
 import time
-import collections
+import copy
+import concurrent.futures
+import itertools
+import json
 import logging
+import operator
+import pkgutil
+import sys
+import types
 from datetime import datetime, timedelta
+import tqdm
 
 log = logging.getLogger("msiempy")
 
-from .core import NitroDict, NitroError, FilteredQueryList
+from .core import (
+    NitroObject,
+    NitroDict,
+    NitroError,
+    NitroSession,
+    FilteredQueryList,
+)
 from .core.utils import (
     timerange_gettimes,
     parse_query_result,
+    parse_query_columns,
     format_fields_for_query,
     divide_times,
     parse_timedelta,
 )
-from .device import DevTree
+
+# Escape the quotes and new lines of the notes in one pass, see `Event.set_note`
+_NOTE_ESCAPE = str.maketrans({'"': '\\"', "\n": "\\n"})
 
 
 class _QueryExecuteManager(FilteredQueryList):
@@ -33,10 +50,18 @@ class _QueryExecuteManager(FilteredQueryList):
     _TYPE = "EVENT"
     """`EVENT`: Flow queries are not implemented (yet)"""
 
+    _PAGE_WORKERS = 4
+    """Number of threads loading the pages of one query result concurrently, see `_iter_event_chunks`: ``4``"""
+
     def __init__(self, *args, **kwargs):
 
         # Declaring filter attributes before calling super() because it would overwrite values
         self._filters = []
+        # SIEM formatted filters, computed once by `_get_filters`
+        self._filters_payload = None
+
+        # Parsed columns names of the running queries, by resultID
+        self._parse_desc_cache = dict()
 
         # Calling super constructor : time_range, filters etc...
         super().__init__(*args, **kwargs)
@@ -45,8 +70,13 @@ class _QueryExecuteManager(FilteredQueryList):
         """
         Returns SIEM formatted filters for the query structured from `msiempy.event.GroupFilter` and/or `msiempy.event.FieldFilter`
         See `msiempy.core.query.FilteredQueryList.filters`.
+
+        The formatted filters are computed once and re-used until a filter is added or the filters are cleared.
+        Filters are dicts in the SIEM format, they are not copied.
         """
-        return [dict(f) for f in self._filters]
+        if self._filters_payload is None:
+            self._filters_payload = list(self._filters)
+        return self._filters_payload
 
     def add_filter(self, afilter):
         """
@@ -57,6 +87,8 @@ class _QueryExecuteManager(FilteredQueryList):
         Arguments:
             - `afilter` (`tuple(field, [values])` or `tuple(field, value)` or `msiempy.event.GroupFilter` or `msiempy.event.FieldFilter`): The filter
         """
+        self._filters_payload = None
+
         if isinstance(afilter, tuple):
             self._filters.append(FieldFilter(afilter[0], afilter[1]))
 
@@ -77,17 +109,32 @@ class _QueryExecuteManager(FilteredQueryList):
         Internal method called by _qry_load_data
         """
         self.nitro.request("close_query", resultID=resultID)
+        self._parse_desc_cache.pop(resultID, None)
+
+    @staticmethod
+    def _is_completed(query_infos):
+        """
+        Internal method that checks if the ``EsmRunningQuery`` object returned on submit reports the query is already completed.
+        """
+        return query_infos.get("complete") is True or (
+            str(query_infos.get("status", "")).lower() == "complete"
+        )
 
-    def _wait_for(self, resultID, wait_timeout_sec, sleep_time=0.2):
+    def _wait_for(self, resultID, wait_timeout_sec, sleep_time=0.05, max_sleep_time=2.0):
         """
         Wait and sleep for the query.  
 
+        The query status is polled with an exponential backoff: the first status check is done right away,
+        then the sleep time grows from ``sleep_time`` up to ``max_sleep_time``.
+        Short queries return after one or two API calls while long queries don't hammer the SIEM.
+
         Internal method called by _qry_load_data
         
         Arguments:
             - `resultID`: Query result ID
             - `wait_timeout_sec` (`int`): Duration in seconds until the query is completed or countdown arrives at zero.
-            - `sleep_time` (`float`): Time to sleep in the waiting loop
+            - `sleep_time` (`float`): Initial time to sleep in the waiting loop
+            - `max_sleep_time` (`float`): Maximum time to sleep in the waiting loop
 
         Returns: 
             `True`
@@ -97,30 +144,100 @@ class _QueryExecuteManager(FilteredQueryList):
             - `TimeoutError`: Query wait timeout
         """
 
-        begin = datetime.now()
-        timeout_delta = timedelta(seconds=wait_timeout_sec)
+        deadline = time.monotonic() + wait_timeout_sec
+        current_sleep = max(0.02, sleep_time)
 
         log.debug("Waiting for the query to be executed on the SIEM...")
 
-        while datetime.now() - timeout_delta < begin:
+        while time.monotonic() < deadline:
             status = self.nitro.request(
                 "query_status", resultID=resultID  # ['value'] # APIv2 change
             )
             if status["complete"] is True:
                 return True
             else:
-                time.sleep(sleep_time)
+                time.sleep(current_sleep)
+                current_sleep = min(current_sleep * 1.5, max_sleep_time)
         raise TimeoutError(
             "Query wait timeout. resultID={}, sleep_time={}, wait_timeout_sec={}".format(
                 resultID, sleep_time, wait_timeout_sec
             )
         )
 
-    def _get_events(self, resultID, startPos=0, numRows=500):
+    def _get_events(
+        self, resultID, startPos=0, numRows=500, chunk_size=500, workers=None
+    ):
         """
         Internal method that will get the query events. 
         Called by `_qry_load_data`.
         By default, ``numRows`` correspond to ``limit``.  
+
+        Results bigger than ``chunk_size`` are loaded by pages, see `_iter_event_chunks`.
+        """
+        events = list()
+        for chunk in self._iter_event_chunks(
+            resultID,
+            startPos=startPos,
+            numRows=numRows,
+            chunk_size=chunk_size,
+            workers=workers,
+        ):
+            events.extend(chunk)
+        return events
+
+    def _iter_event_chunks(
+        self, resultID, startPos=0, numRows=500, chunk_size=500, workers=None
+    ):
+        """
+        Internal generator that yields the query events by pages of ``chunk_size`` rows, in order.
+
+        The first page is requested alone, if it's full, the next pages are requested concurrently 
+        with ``workers`` threads (default to `_PAGE_WORKERS`) so the network requests overlap with the parsing of the previous pages.
+        At most ``workers`` pages are requested ahead of the consumed page, no page is requested after the first incomplete page.
+        """
+        if workers is None:
+            workers = self._PAGE_WORKERS
+        end = startPos + numRows
+        first_rows = min(numRows, chunk_size)
+        chunk = self._get_events_page(resultID, startPos=startPos, numRows=first_rows)
+        yield chunk
+        if len(chunk) < first_rows or end <= startPos + first_rows:
+            return
+
+        # At most `workers` pages are requested ahead, the next page is requested when a full page is received
+        positions = iter(range(startPos + first_rows, end, chunk_size))
+        pending = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def request_next_page():
+                pos = next(positions, None)
+                if pos is not None:
+                    rows = min(chunk_size, end - pos)
+                    future = executor.submit(
+                        self._get_events_page, resultID, startPos=pos, numRows=rows,
+                    )
+                    pending.append((future, rows))
+
+            for _ in range(workers):
+                request_next_page()
+            try:
+                while pending:
+                    future, rows = pending.pop(0)
+                    chunk = future.result()
+                    full = len(chunk) == rows
+                    if full:
+                        request_next_page()
+                    yield chunk
+                    if not full:
+                        break
+            finally:
+                # Do not request the remaining pages if the result is shorter than expected
+                for future, _ in pending:
+                    future.cancel()
+
+    def _get_events_page(self, resultID, startPos=0, numRows=500):
+        """
+        Internal method that will get and parse one page of the query events. 
         """
         result = self.nitro.request(
             "query_result",
@@ -130,29 +247,40 @@ class _QueryExecuteManager(FilteredQueryList):
         )
 
         # Calls a utils function to parse the [columns][rows]
-        #   to format into list of dict
-        # log.debug("Parsing colums : "+str(result['columns'])[:200])
-        # log.debug("Parsing rows : "+str(result['rows'])[:200])
-        if len(result["columns"]) != len(
-            set([column["name"] for column in result["columns"]])
-        ):
-            log.error(
-                "You requested duplicated fields, the parsed fields/values results will be missmatched !"
-            )
-        events = parse_query_result(result["columns"], result["rows"])
+        #   to format into list of dict.
+        # All the pages of a query result share the same columns,
+        #   so they are parsed only once per resultID.
+        names = self._parse_desc_cache.get(resultID)
+        if names is None or len(names) != len(result["columns"]):
+            names = parse_query_columns(result["columns"])
+            seen = set()
+            for name in names:
+                if name in seen:
+                    log.error(
+                        "You requested duplicated fields, the parsed fields/values results will be missmatched !"
+                    )
+                    break
+                seen.add(name)
+            self._parse_desc_cache[resultID] = names
+
+        events = self._parse_rows(names, result["rows"])
         # log.debug("Event(s) parsed : "+str(events)[:200])
         return events
 
+    def _parse_rows(self, names, rows):
+        """
+        Internal method that parses the query result rows into a list of dict. 
+        Called by `_get_events_page` with the parsed columns names.
+        """
+        return parse_query_result(None, rows, names=names)
+
     @staticmethod
     def get_field_nickname(field):
         """
         Resolve SIEM events field nickname base on `Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME` mapping.
         Returns the valid query field nickname if found else the initial value.
         """
-        if field in Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME:
-            return Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME[field]
-        else:
-            return field
+        return Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME.get(field, field)
 
 
 class EventManager(_QueryExecuteManager):
@@ -241,20 +369,15 @@ class EventManager(_QueryExecuteManager):
         # Store the query parent
         self._parent = _parent
 
-        # Setting the default fields Adds the specified fields, make sure there is no duplicates and delete TABLE identifiers
-        self.fields = []
-        """
-        List of query fields
-        """
+        # Store the first query of the query tree, `None` if this query is the first one.
+        # The parent's root is already resolved, so the lookup is O(1) at any depth
+        self._root = _parent._root_parent if _parent != None else None
 
-        if fields and len(fields) > 0:
-            all_keys = Event.DEFAULTS_EVENT_FIELDS + list(fields)
-            uniquekeys = set()
-            for k in all_keys:
-                uniquekeys.add(self.get_field_nickname(k))
-            self.fields = list(uniquekeys)
-        else:
-            self.fields = Event.DEFAULTS_EVENT_FIELDS
+        # Thread pool shared by all the sub-queries, set on the root query while loading
+        self._executor = None
+
+        # Setting the default fields Adds the specified fields, make sure there is no duplicates and delete TABLE identifiers
+        self.fields = self._with_default_fields(fields)
         # log.debug('{}\nFIELDS : {}'.format(locals(), self.fields))
 
         # Setting limit according to limit argument
@@ -269,17 +392,57 @@ class EventManager(_QueryExecuteManager):
         self.order = order
 
         # Type cast all items in the list "data" to events type objects
-        # Casting all data to Event objects, better way to do it ?
-        collections.UserList.__init__(
-            self,
-            [
-                Event(adict=item)
-                for item in self.data
-                if isinstance(item, (dict, NitroDict))
-            ],
-        )
+        # Items that are already Event objects are kept as is
+        if self.data:
+            events = []
+            append = events.append
+            for item in self.data:
+                if type(item) is Event:
+                    append(item)
+                elif isinstance(item, (dict, NitroDict)):
+                    append(Event(adict=item))
+            self.data = events
+
+    @staticmethod
+    def _with_default_fields(fields):
+        """
+        Returns the default event fields followed by the specified fields, without duplicates and with nicknames when possible.
+        """
+        if fields and len(fields) > 0:
+            # Insertion ordered dict used as a set to keep the fields order
+            mapping = Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME
+            return list(
+                dict.fromkeys(
+                    mapping.get(k, k)
+                    for k in itertools.chain(Event.DEFAULTS_EVENT_FIELDS, fields)
+                )
+            )
+        else:
+            return Event.DEFAULTS_EVENT_FIELDS
+
+    def _get_fields(self):
+        return self._fields
+
+    def _set_fields(self, fields):
+        self._fields = fields
+        self._fields_payload = None
+
+    fields = property(fget=_get_fields, fset=_set_fields)
+    """
+    List of query fields.
+
+    Note:
+        Re-assign the list to change the query fields, the SIEM formatted fields are computed once per assignment.
+    """
+
+    def _get_fields_payload(self):
+        """
+        Returns SIEM formatted fields for the query. Computed once per `fields` assignment.
+        """
+        if self._fields_payload is None:
+            self._fields_payload = format_fields_for_query(self.fields)
+        return self._fields_payload
 
-    
     def _get_order(self):
         return (self._order_direction, self._order_field)
 
@@ -310,6 +473,7 @@ class EventManager(_QueryExecuteManager):
         Replace all filters by a non filtering rule.
         Acts like there is not filters.
         """
+        self._filters_payload = None
         self._filters = [
             {
                 "type": "EsmFieldFilter",
@@ -319,6 +483,14 @@ class EventManager(_QueryExecuteManager):
             }
         ]
 
+    def _parse_rows(self, names, rows):
+        """
+        Internal method that parses the query result rows into a list of `Event`. 
+        The events data are built only when the events are accessed, see `Event.from_row`.
+        """
+        from_row = Event.from_row
+        return [from_row(names, row["values"]) for row in rows]
+
     def _qry_load_data(self, retry=1, wait_timeout_sec=120):
         """
         Internal helper method to execute the query and load the data:
@@ -331,7 +503,7 @@ class EventManager(_QueryExecuteManager):
             - `wait_timeout_sec` (`int`): wait timeout in seconds. (Default value = 120)
 
         Returns: 
-            tuple: ( `msiempy.event.EventManager`, Query completed? `bool` )
+            tuple: ( `list[Event]`, Query completed? `bool` )
 
         Raises:
             - `msiempy.core.session.NitroError`: If any unhandled errors.
@@ -349,7 +521,7 @@ class EventManager(_QueryExecuteManager):
                     end_time=self.end_time,
                     order_direction=self._order_direction,
                     order_field=self._order_field,
-                    fields=format_fields_for_query(self.fields),
+                    fields=self._get_fields_payload(),
                     filters=self.filters,
                     limit=self.limit,
                     offset=0,
@@ -362,22 +534,25 @@ class EventManager(_QueryExecuteManager):
                     time_range=self.time_range,
                     order_direction=self._order_direction,
                     order_field=self._order_field,
-                    fields=format_fields_for_query(self.fields),
+                    fields=self._get_fields_payload(),
                     filters=self.filters,
                     limit=self.limit,
                     offset=0,
                     includeTotal=False,
                 )
 
-            log.debug("Waiting for EsmRunningQuery object : " + str(query_infos))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Waiting for EsmRunningQuery object : %s", query_infos)
 
-            self._wait_for(query_infos["resultID"], wait_timeout_sec)
+            # Do not poll the query status if the query is already completed
+            if not self._is_completed(query_infos):
+                self._wait_for(query_infos["resultID"], wait_timeout_sec)
             events_raw = self._get_events(query_infos["resultID"], numRows=self.limit)
             self._close_query(query_infos["resultID"])
 
         except (NitroError, TimeoutError) as error:
             if retry > 0:
-                log.warning("Retring _qry_load_data() after error: " + str(error))
+                log.warning("Retring _qry_load_data() after error: %s", error)
                 time.sleep(1)
                 return self._qry_load_data(retry=retry - 1)
             else:
@@ -403,7 +578,7 @@ class EventManager(_QueryExecuteManager):
             `msiempy.event.EventManager`
 
         Note: 
-            Only the first query is loaded asynchronously.
+            Sub-queries of every depth are loaded asynchronously through a single thread pool of ``workers`` threads.
         """
 
         items, completed = self._qry_load_data()
@@ -414,19 +589,7 @@ class EventManager(_QueryExecuteManager):
             if max_query_depth > 0:
                 # log.info("The query data couldn't be loaded in one request, separating it in sub-queries...")
 
-                if (
-                    self.time_range != "CUSTOM"
-                ):  # can raise a NotImplementedError if unsupported time_range
-                    start, end = timerange_gettimes(self.time_range)
-                else:
-                    start, end = self.start_time, self.end_time
-
-                if self._parent == None and isinstance(delta, str):
-                    # if it's the first query and delta is speficied, cut the time_range in slots according to the delta
-                    times = divide_times(start, end, delta=parse_timedelta(delta))
-
-                else:
-                    times = divide_times(start, end, slots=slots)
+                times = self._get_sub_times(slots=slots, delta=delta)
 
                 if workers > len(times):
                     log.warning(
@@ -437,61 +600,168 @@ class EventManager(_QueryExecuteManager):
                         + ". Number of slots should be greater than the number of workers for better performance."
                     )
 
-                sub_queries = list()
-
-                for time in times:  # reversed(times) :
-                    # Divide the query in sub queries
-                    sub_query = EventManager(
-                        fields=self.fields,
-                        order=self.order,
-                        limit=self.limit,
-                        filters=self._filters,
-                        time_range="CUSTOM",
-                        start_time=time[0].isoformat(),
-                        end_time=time[1].isoformat(),
-                        _parent=self,
-                    )
-
-                    sub_queries.append(sub_query)
-
-                results = self.perform(
-                    EventManager.load_data,
-                    sub_queries,
-                    # The sub query is asynch only when it's the first query (root parent)
-                    asynch=self._parent == None,
-                    progress=self._parent == None,
-                    message="Loading data from "
-                    + start
-                    + " to "
-                    + end
-                    + ". In {} slots".format(len(times)),
-                    func_args=dict(slots=slots, max_query_depth=max_query_depth - 1),
-                    workers=workers,
-                )
-
-                # Flatten the list of lists in a list
-                items = [item for sublist in results for item in sublist]
+                # All the sub-queries share the same session, size the connection pool
+                # for the workers and the concurrent result pages requests of each of them
+                self.nitro._ensure_pool_size(workers * self._PAGE_WORKERS)
+
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=workers
+                ) as executor:
+                    self._executor = executor
+                    try:
+                        items = self._load_sub_queries(
+                            times, slots=slots, max_query_depth=max_query_depth
+                        )
+                    finally:
+                        self._executor = None
 
             else:
-                if not self._root_parent.not_completed:
-                    log.warning(
-                        "The query is not complete... Try to divide in more slots or increase max_query_depth"
-                    )
-                    self._root_parent.not_completed = True
+                self._warn_not_completed()
 
-        events = [Event(adict=item) for item in items]
-        self.data = events
+        # The items are already events, see `_parse_rows`
+        self.data = items
         return self
 
+    def _get_sub_times(self, slots=10, delta=None):
+        """
+        Internal method that divides the query time range in time slots.
+        The ``delta`` is only applied to the first query of the query tree.
+
+        Returns:
+            `list[tuple(datetime, datetime)]`
+        """
+        if (
+            self.time_range != "CUSTOM"
+        ):  # can raise a NotImplementedError if unsupported time_range
+            start, end = timerange_gettimes(self.time_range)
+        else:
+            start, end = self.start_time, self.end_time
+
+        if self._parent == None and isinstance(delta, str):
+            # if it's the first query and delta is speficied, cut the time_range in slots according to the delta
+            return divide_times(start, end, delta=parse_timedelta(delta))
+        else:
+            return divide_times(start, end, slots=slots)
+
+    def _load_sub_queries(self, times, slots=10, max_query_depth=1):
+        """
+        Internal method that loads the sub-queries of every depth through the root query executor.
+
+        As soon as a sub-query returns, it's divided again if it's not completed,
+        its own sub-queries are submitted right away so the workers are never idle.
+        The results are ordered by time slot, the same way the reccursive division would order them.
+
+        Arguments:
+            - `times` (`list[tuple(datetime, datetime)]`): Time slots of the first division
+            - `slots` (`int`): number of time slots the sub-queries can be divided
+            - `max_query_depth` (`int`): Maximum number of reccursive divisions, including the first one
+
+        Returns:
+            `list[dict]`
+        """
+        executor = self._root_parent._executor
+        # Map the running futures to (slot index path, remaining depth)
+        running = dict()
+        results = dict()
+
+        def load_sub_query(parent, time_slot):
+            # Divide the query in sub queries.
+            # The sub query is created by the worker, only when it's about to be executed
+            sub_query = EventManager(
+                fields=parent.fields,
+                order=parent.order,
+                limit=parent.limit,
+                filters=parent._filters,
+                time_range="CUSTOM",
+                start_time=time_slot[0].isoformat(),
+                end_time=time_slot[1].isoformat(),
+                _parent=parent,
+            )
+            # Share the formatted fields and filters, they are the same as the parent's
+            sub_query._fields_payload = parent._get_fields_payload()
+            sub_query._filters_payload = parent.filters
+            return (sub_query, sub_query._qry_load_data())
+
+        def submit(parent, slot_path, sub_times, depth):
+            for i, time_slot in enumerate(sub_times):
+                future = executor.submit(load_sub_query, parent, time_slot)
+                running[future] = (slot_path + (i,), depth)
+
+        start, end = times[0][0].isoformat(), times[-1][1].isoformat()
+        message = "Loading data from {} to {}. In {} slots".format(
+            start, end, len(times)
+        )
+        progress = None
+        if self._parent == None and not self.nitro.config.quiet:
+            progress = tqdm.tqdm(desc=message, total=len(times))
+        else:
+            log.info(message)
+
+        submit(self, tuple(), times, max_query_depth - 1)
+
+        try:
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    slot_path, depth = running.pop(future)
+                    sub_query, (sub_items, completed) = future.result()
+
+                    if not completed and depth > 0:
+                        sub_times = sub_query._get_sub_times(slots=slots)
+                        submit(sub_query, slot_path, sub_times, depth - 1)
+                        if progress:
+                            progress.total += len(sub_times)
+                            progress.refresh()
+                    else:
+                        if not completed:
+                            sub_query._warn_not_completed()
+                        results[slot_path] = sub_items
+
+                    if progress:
+                        progress.update()
+        finally:
+            if progress:
+                progress.close()
+
+        # Flatten the results in time slot order
+        return list(
+            itertools.chain.from_iterable(
+                results[slot_path] for slot_path in sorted(results)
+            )
+        )
+
+    def refresh_all(self, use_query=None, extra_fields=None, max_concurrency=8):
+        """
+        Re-load the data of all the events, see `refresh_events`.
+        """
+        refresh_events(
+            self,
+            use_query=use_query,
+            extra_fields=extra_fields,
+            max_concurrency=max_concurrency,
+        )
+
+    def _warn_not_completed(self):
+        """
+        Internal method that warns once per query tree that the query is not completed.
+        """
+        if not self._root_parent.not_completed:
+            log.warning(
+                "The query is not complete... Try to divide in more slots or increase max_query_depth"
+            )
+            self._root_parent.not_completed = True
+
     @property
     def _root_parent(self):
         """
         Internal method that return the first query of the query tree.
         """
-        if self._parent == None:
+        if self._root == None:
             return self
         else:
-            return self._parent._root_parent
+            return self._root
 
     def get_possible_fields(self):
         """
@@ -544,6 +814,14 @@ class GroupedEventManager(_QueryExecuteManager):
 
     """
 
+    DEV_TREE_CACHE_TTL = 300
+    """
+    Number of seconds the datasources IPSIDs loaded by `clear_filters` are cached: ``300``
+    """
+
+    # Tuple (datasources IPSIDs, time.monotonic() of the load) shared by all the grouped queries
+    _dev_tree_cache = None
+
     def __init__(self, *args, field=None, **kwargs):
         """
         Create a new grouped query
@@ -566,18 +844,21 @@ class GroupedEventManager(_QueryExecuteManager):
         if field:
             if not isinstance(field, str):
                 raise TypeError("Argument field must be a string. Not {}".format(field))
-            self.field = self.get_field_nickname(field)
+            self.field = Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME.get(
+                field, field
+            )
 
         # Type cast all items in the list "data" to events type objects
-        # Casting all data to Event objects, better way to do it ?
-        collections.UserList.__init__(
-            self,
-            [
-                GroupedEvent(item)
-                for item in self.data
-                if isinstance(item, (dict, NitroDict))
-            ],
-        )
+        # Items that are already GroupedEvent objects are kept as is
+        if self.data:
+            events = []
+            append = events.append
+            for item in self.data:
+                if type(item) is GroupedEvent:
+                    append(item)
+                elif isinstance(item, (dict, NitroDict)):
+                    append(GroupedEvent(item))
+            self.data = events
 
     def load_data(self, *args, **kwargs):
         """
@@ -605,8 +886,18 @@ class GroupedEventManager(_QueryExecuteManager):
         log.info(
             "Setting a generic filter to the grouped query with all datasources IPSIDs..."
         )
-        tree = DevTree()
-        dsids = [d["ds_id"] for d in tree]
+        cache = GroupedEventManager._dev_tree_cache
+        if cache and time.monotonic() - cache[1] < self.DEV_TREE_CACHE_TTL:
+            dsids = list(cache[0])
+        else:
+            # Only needed here. This doesn't save any import time:
+            # the msiempy package imports the device module before the event module.
+            from .device import DevTree
+
+            tree = DevTree()
+            dsids = list(map(operator.itemgetter("ds_id"), tree))
+            GroupedEventManager._dev_tree_cache = (tuple(dsids), time.monotonic())
+        self._filters_payload = None
         self._filters = [
             {
                 "type": "EsmFieldFilter",
@@ -662,15 +953,18 @@ class GroupedEventManager(_QueryExecuteManager):
                     filters=self.filters,
                 )
 
-            log.debug("Waiting for EsmRunningQuery object : " + str(query_infos))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Waiting for EsmRunningQuery object : %s", query_infos)
 
-            self._wait_for(query_infos["resultID"], wait_timeout_sec)
+            # Do not poll the query status if the query is already completed
+            if not self._is_completed(query_infos):
+                self._wait_for(query_infos["resultID"], wait_timeout_sec)
             events_raw = self._get_events(query_infos["resultID"], numRows=num_rows)
             self._close_query(query_infos["resultID"])
 
         except (NitroError, TimeoutError) as error:
             if retry > 0:
-                log.warning("Retring _qry_load_data() after error: " + str(error))
+                log.warning("Retring _qry_load_data() after error: %s", error)
                 time.sleep(1)
                 return self._qry_load_data(retry=retry - 1)
             else:
@@ -679,6 +973,62 @@ class GroupedEventManager(_QueryExecuteManager):
         return (events_raw, len(events_raw) < num_rows)
 
 
+# INTERNAL NAMES TO NICKNAME
+SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME = json.loads(
+    pkgutil.get_data(__name__, "event_fields.json")
+)
+
+# NICKNAME TO INTERNAL NAMES
+SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME = {
+    v: k for k, v in SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME.items()
+}
+# Fields without nickname, mapped to themselves
+SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME.update(
+    (field, field)
+    for field in [
+        "Action.Name",
+        "Class.Name",
+        "Class.Priority",
+        "GeoLoc_ASNGeoDst.Latitude",
+        "GeoLoc_ASNGeoDst.Longitude",
+        "GeoLoc_ASNGeoDst.Msg",
+        "GeoLoc_ASNGeoDst.XCoord",
+        "GeoLoc_ASNGeoDst.YCoord",
+        "GeoLoc_ASNGeoSrc.Latitude",
+        "GeoLoc_ASNGeoSrc.Longitude",
+        "GeoLoc_ASNGeoSrc.Msg",
+        "GeoLoc_ASNGeoSrc.XCoord",
+        "GeoLoc_ASNGeoSrc.YCoord",
+        "IPS.Name",
+        "Rule.ID",
+        "Rule.NormID",
+        "Rule.msg",
+        "Rule_NDSNormSigID.msg",
+        "ThirdPartyType.Name",
+        "Users.Name",
+        "Zone_ZoneDst.Name",
+        "Zone_ZoneSrc.Name",
+    ]
+)
+
+# Intern the fields names so the dict lookups of the same names compare by identity
+# Read-only views, the maps are shared by all events
+SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME = types.MappingProxyType({
+    sys.intern(k): sys.intern(v)
+    for k, v in SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME.items()
+})
+"""
+Fields name mapping. See `Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME`.
+"""
+SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME = types.MappingProxyType({
+    sys.intern(k): sys.intern(v)
+    for k, v in SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME.items()
+})
+"""
+Fields name mapping (reversed). See `Event.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME`.
+"""
+
+
 class Event(NitroDict):
     """
     Dict-Like object. Represents an event in the SIEM.  
@@ -790,9 +1140,13 @@ class Event(NitroDict):
         "Zone_ZoneDst",
         "Zone_ZoneSrc",
     ]
+    FIELDS_TABLES = [sys.intern(table) for table in FIELDS_TABLES]
     """List of internal fields table : `Rule`,`Alert`,etc.
     """
 
+    # Position of the tables in FIELDS_TABLES, the lower wins when resolving a field without table prefix
+    _FIELDS_TABLES_PRIORITY = {table: i for i, table in enumerate(FIELDS_TABLES)}
+
     # Minimal default query fields
     DEFAULTS_EVENT_FIELDS = ["Rule.msg", "LastTime", "IPSIDAlertID"]
     """Always present when using `msiempy.event.EventManager` querying :  
@@ -816,601 +1170,39 @@ class Event(NitroDict):
         "Alert.DSIDSigID",
         "Alert.IPSIDAlertID",
     ]
+    REGULAR_EVENT_FIELDS = [sys.intern(field) for field in REGULAR_EVENT_FIELDS]
     """
     Offer a base list of regular fields that may be useful.
 
     ``Rule.msg``,  ``Alert.SrcIP``,  ``Alert.DstIP``,   ``Alert.SrcMac``,  ``Alert.DstMac``,  ``Rule.NormID``,  ``HostID``,  ``UserIDSrc``,  ``ObjectID``,  ``Alert.Severity``,  ``Alert.LastTime``,  ``Alert.DSIDSigID``,  ``Alert.IPSIDAlertID`` 
     """
 
-    SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME = {
-        "Alert.105250817": "DNS - Response_Code_Name",
-        "Alert.122028033": "DNS - Query",
-        "Alert.196609": "Queue_ID",
-        "Alert.21364737": "DNS - Class",
-        "Alert.21364738": "Registry - Key",
-        "Alert.21364739": "Old_Reputation - GTI_File",
-        "Alert.21364740": "New_Reputation - GTI_File",
-        "Alert.262145": "Response_Time",
-        "Alert.262146": "NAT_Details",
-        "Alert.262152": "PID",
-        "Alert.262153": "Grid_Master_IP",
-        "Alert.262154": "Device_IP",
-        "Alert.262155": "Device_Port",
-        "Alert.262156": "External_EventID",
-        "Alert.262157": "Spam_Score",
-        "Alert.262158": "External_SubEventID",
-        "Alert.262159": "File_Hash",
-        "Alert.262160": "Handle_ID",
-        "Alert.262161": "Instance_GUID",
-        "Alert.262162": "Agent_GUID",
-        "Alert.262163": "UUID",
-        "Alert.262164": "Reputation",
-        "Alert.262165": "DAT_Version",
-        "Alert.262166": "Server_ID",
-        "Alert.262167": "Policy_ID",
-        "Alert.262168": "Handheld_ID",
-        "Alert.262169": "Database_GUID",
-        "Alert.262170": "Analyzer_DAT_Version",
-        "Alert.262171": "Reputation_Score",
-        "Alert.262172": "Parent_File_Hash",
-        "Alert.262173": "Incident_ID",
-        "Alert.262174": "Victim_IP",
-        "Alert.262175": "Attacker_IP",
-        "Alert.262176": "Object_GUID",
-        "Alert.262177": "Reputation_Server_IP",
-        "Alert.262178": "DNS_Server_IP",
-        "Alert.262179": "Device_Confidence",
-        "Alert.38141953": "DNS - Class_Name",
-        "Alert.38141954": "Registry - Value",
-        "Alert.38141955": "Old_Reputation - TIE_File",
-        "Alert.38141956": "New_Reputation - TIE_File",
-        "Alert.4259841": "URL",
-        "Alert.4259842": "Message_Text",
-        "Alert.4259843": "Filename",
-        "Alert.4259844": "From",
-        "Alert.4259845": "To",
-        "Alert.4259846": "Cc",
-        "Alert.4259847": "Bcc",
-        "Alert.4259848": "Subject",
-        "Alert.4259849": "User_Agent",
-        "Alert.4259850": "Cookie",
-        "Alert.4259851": "Referer",
-        "Alert.4259852": "Destination_Filename",
-        "Alert.4259853": "Client_Version",
-        "Alert.4259854": "Job_Name",
-        "Alert.4259855": "Language",
-        "Alert.4259856": "SWF_URL",
-        "Alert.4259857": "TC_URL",
-        "Alert.4259858": "RTMP_Application",
-        "Alert.4259859": "Version",
-        "Alert.4259860": "Local_User_Name",
-        "Alert.4259867": "DNS_Name",
-        "Alert.4259868": "SNMP_Item",
-        "Alert.4259869": "Sensor_UUID",
-        "Alert.4259870": "Process_Name",
-        "Alert.4259871": "Source_Context",
-        "Alert.4259872": "Target_Context",
-        "Alert.4259873": "Description",
-        "Alert.4259874": "SQL_Statement",
-        "Alert.4259875": "From_Address",
-        "Alert.4259876": "To_Address",
-        "Alert.4259877": "File_Path",
-        "Alert.4259878": "Target_Process_Name",
-        "Alert.4259879": "Privileges",
-        "Alert.4259880": "Search_Query",
-        "Alert.4259881": "PCAP_Name",
-        "Alert.4259882": "Vulnerability_References",
-        "Alert.4259883": "Access_Privileges",
-        "Alert.4259884": "Old_Value",
-        "Alert.4259885": "New_Value",
-        "Alert.4259886": "Device_URL",
-        "Alert.4259887": "Engine_List",
-        "Alert.4456449": "Num_Copies",
-        "Alert.4456450": "Start_Page",
-        "Alert.4456451": "End_Page",
-        "Alert.4456457": "NTP_Offset_To_Monitor",
-        "Alert.4456458": "Confidence",
-        "Alert.4456459": "Hops",
-        "Alert.4456460": "Priority",
-        "Alert.54919169": "DNS - Type",
-        "Alert.54919171": "Old_Reputation - ATD_File",
-        "Alert.54919172": "New_Reputation - ATD_File",
-        "Alert.65537": "Signature_Name",
-        "Alert.65538": "Threat_Name",
-        "Alert.65539": "Destination_Hostname",
-        "Alert.65540": "Category",
-        "Alert.65541": "Source_Zone",
-        "Alert.65542": "Destination_Zone",
-        "Alert.65543": "Target_Class",
-        "Alert.65544": "Policy_Name",
-        "Alert.65545": "Event_Class",
-        "Alert.65546": "Request_Type",
-        "Alert.65547": "Message_ID",
-        "Alert.65548": "Mail_ID",
-        "Alert.65549": "Recipient_ID",
-        "Alert.65550": "Delivery_ID",
-        "Alert.65551": "Creator_Name",
-        "Alert.65552": "External_Application",
-        "Alert.65553": "External_DB2_Server",
-        "Alert.65554": "Table_Name",
-        "Alert.65555": "Access_Resource",
-        "Alert.65556": "Catalog_Name",
-        "Alert.65557": "DB2_Plan_Name",
-        "Alert.65558": "File_Type",
-        "Alert.65559": "FTP_Command",
-        "Alert.65560": "Job_Type",
-        "Alert.65561": "Logical_Unit_Name",
-        "Alert.65562": "LPAR_DB2_Subsystem",
-        "Alert.65563": "Step_Count",
-        "Alert.65564": "Step_Name",
-        "Alert.65565": "Volume_ID",
-        "Alert.65566": "Source_UserID",
-        "Alert.65567": "Destination_UserID",
-        "Alert.65568": "Mainframe_Job_Name",
-        "Alert.65569": "Database_ID",
-        "Alert.65570": "Malware_Insp_Action",
-        "Alert.65571": "Malware_Insp_Result",
-        "Alert.65572": "Source_Network",
-        "Alert.65573": "Destination_Network",
-        "Alert.65574": "Incoming_ID",
-        "Alert.65575": "External_Hostname",
-        "Alert.65576": "Area",
-        "Alert.65577": "Facility",
-        "Alert.65578": "Privileged_User",
-        "Alert.65579": "Operating_System",
-        "Alert.65580": "Logon_Type",
-        "Alert.65581": "Management_Server",
-        "Alert.65582": "External_SessionID",
-        "Alert.65583": "Source_Logon_ID",
-        "Alert.65584": "Destination_Logon_ID",
-        "Alert.65585": "Session_Status",
-        "Alert.65586": "URL_Category",
-        "Alert.65587": "Caller_Process",
-        "Alert.65588": "Registry_Key",
-        "Alert.65589": "Registry_Value",
-        "Alert.65590": "Mailbox",
-        "Alert.65591": "Directory",
-        "Alert.65592": "Destination_Directory",
-        "Alert.65593": "SQL_Command",
-        "Alert.65594": "Device_Action",
-        "Alert.65595": "Threat_Category",
-        "Alert.65596": "Threat_Handled",
-        "Alert.65597": "Reason",
-        "Alert.65599": "Detection_Method",
-        "Alert.65600": "Virtual_Machine_Name",
-        "Alert.65601": "Virtual_Machine_ID",
-        "Alert.65602": "Datacenter_ID",
-        "Alert.65603": "Datacenter_Name",
-        "Alert.65604": "Interface_Dest",
-        "Alert.65605": "Organizational_Unit",
-        "Alert.65606": "External_Device_Type",
-        "Alert.65607": "External_Device_ID",
-        "Alert.65608": "External_Device_Name",
-        "Alert.65609": "Service_Name",
-        "Alert.65610": "Reputation_Name",
-        "Alert.65611": "Status",
-        "Alert.65612": "Sub_Status",
-        "Alert.65613": "Web_Domain",
-        "Alert.65614": "Group_Name",
-        "Alert.65615": "App_Layer_Protocol",
-        "Alert.65616": "Rule_Name",
-        "Alert.65617": "Security_ID",
-        "Alert.65618": "Authentication_Type",
-        "Alert.65619": "SHA1",
-        "Alert.65620": "File_ID",
-        "Alert.65621": "Attribute_Type",
-        "Alert.65622": "Access_Mask",
-        "Alert.65623": "VPN_Feature_Name",
-        "Alert.65624": "Hash",
-        "Alert.65625": "Hash_Type",
-        "Alert.65627": "Subcategory",
-        "Alert.65628": "CnC_Host",
-        "Alert.65629": "Share_Name",
-        "Alert.65630": "SHA256",
-        "Alert.71696385": "DNS - Type_Name",
-        "Alert.71696387": "Old_Reputation - GTI_Cert",
-        "Alert.71696388": "New_Reputation - GTI_Cert",
-        "Alert.88473601": "DNS - Response_Code",
-        "Alert.88473603": "Old_Reputation - TIE_Cert",
-        "Alert.88473604": "New_Reputation - TIE_Cert",
-        "Alert.ASNGeoDst": "ASNGeoDst",
-        "Alert.ASNGeoSrc": "ASNGeoSrc",
-        "Alert.Action": "Action",
-        "Alert.AlertID": "AlertID",
-        "Alert.AppIDCat": "AppIDCat",
-        "Alert.AvgSeverity": "AvgSeverity",
-        "Alert.BIN(1)": "AppID",
-        "Alert.BIN(10)": "Object_Type",
-        "Alert.BIN(11)": "Method",
-        "Alert.BIN(12)": "File_Operation",
-        "Alert.BIN(13)": "File_Operation_Succeeded",
-        "Alert.BIN(14)": "User_Nickname",
-        "Alert.BIN(15)": "Contact_Name",
-        "Alert.BIN(16)": "Contact_Nickname",
-        "Alert.BIN(17)": "DNS_Type",
-        "Alert.BIN(18)": "DNS_Class",
-        "Alert.BIN(19)": "Query_Response",
-        "Alert.BIN(2)": "CommandID",
-        "Alert.BIN(20)": "Authoritative_Answer",
-        "Alert.BIN(21)": "SNMP_Operation",
-        "Alert.BIN(22)": "SNMP_Item_Type",
-        "Alert.BIN(23)": "SNMP_Version",
-        "Alert.BIN(24)": "SNMP_Error_Code",
-        "Alert.BIN(25)": "NTP_Client_Mode",
-        "Alert.BIN(26)": "NTP_Server_Mode",
-        "Alert.BIN(27)": "NTP_Request",
-        "Alert.BIN(28)": "NTP_Opcode",
-        "Alert.BIN(29)": "Interface",
-        "Alert.BIN(3)": "DomainID",
-        "Alert.BIN(30)": "Direction",
-        "Alert.BIN(31)": "Sensor_Name",
-        "Alert.BIN(32)": "Sensor_Type",
-        "Alert.BIN(33)": "Response_Code",
-        "Alert.BIN(34)": "Return_Code",
-        "Alert.BIN(4)": "HostID",
-        "Alert.BIN(5)": "ObjectID",
-        "Alert.BIN(6)": "UserIDDst",
-        "Alert.BIN(7)": "UserIDSrc",
-        "Alert.BIN(8)": "Database_Name",
-        "Alert.BIN(9)": "Application_Protocol",
-        "Alert.CommandIDCat": "CommandIDCat",
-        "Alert.DSID": "DSID",
-        "Alert.DSIDSigID": "DSIDSigID",
-        "Alert.DomainIDCat": "DomainIDCat",
-        "Alert.DstIP": "DstIP",
-        "Alert.DstMac": "DstMac",
-        "Alert.DstPort": "DstPort",
-        "Alert.EventCount": "EventCount",
-        "Alert.FirstTime": "FirstTime",
-        "Alert.Flow": "Flow",
-        "Alert.FlowID": "FlowID",
-        "Alert.GUIDDst": "GUIDDst",
-        "Alert.GUIDSrc": "GUIDSrc",
-        "Alert.HostIDCat": "HostIDCat",
-        "Alert.IPSID": "IPSID",
-        "Alert.IPSIDAlertID": "IPSIDAlertID",
-        "Alert.LastTime": "LastTime",
-        "Alert.LastTime_usec": "LastTime_usec",
-        "Alert.ObjectIDCat": "ObjectIDCat",
-        "Alert.Protocol": "Protocol",
-        "Alert.RemCaseID": "RemCaseID",
-        "Alert.RemOpenTicketTime": "RemOpenTicketTime",
-        "Alert.Reviewed": "Reviewed",
-        "Alert.Sequence": "Sequence",
-        "Alert.SessionID": "SessionID",
-        "Alert.Severity": "Severity",
-        "Alert.SigID": "SigID",
-        "Alert.SrcIP": "SrcIP",
-        "Alert.SrcMac": "SrcMac",
-        "Alert.SrcPort": "SrcPort",
-        "Alert.Trusted": "Trusted",
-        "Alert.UserFld10Cat": "UserFld10Cat",
-        "Alert.UserFld21Cat": "UserFld21Cat",
-        "Alert.UserFld22Cat": "UserFld22Cat",
-        "Alert.UserFld23Cat": "UserFld23Cat",
-        "Alert.UserFld24Cat": "UserFld24Cat",
-        "Alert.UserFld25Cat": "UserFld25Cat",
-        "Alert.UserFld26Cat": "UserFld26Cat",
-        "Alert.UserFld27Cat": "UserFld27Cat",
-        "Alert.UserFld8Cat": "UserFld8Cat",
-        "Alert.UserFld9Cat": "UserFld9Cat",
-        "Alert.UserIDDstCat": "UserIDDstCat",
-        "Alert.UserIDSrcCat": "UserIDSrcCat",
-        "Alert.VLan": "VLan",
-        "Alert.WriteTime": "WriteTime",
-        "Alert.ZoneDst": "ZoneDst",
-        "Alert.ZoneSrc": "ZoneSrc",
-    }
+    SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME = SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME
     """
     Fields name mapping.  
     """
 
-    # NICKNAME TO INTERNAL NAMES
-    SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME = {
-        "ASNGeoDst": "Alert.ASNGeoDst",
-        "ASNGeoSrc": "Alert.ASNGeoSrc",
-        "Access_Mask": "Alert.65622",
-        "Access_Privileges": "Alert.4259883",
-        "Access_Resource": "Alert.65555",
-        "Action": "Alert.Action",
-        "Action.Name": "Action.Name",
-        "Agent_GUID": "Alert.262162",
-        "AlertID": "Alert.AlertID",
-        "Analyzer_DAT_Version": "Alert.262170",
-        "AppID": "Alert.BIN(1)",
-        "AppIDCat": "Alert.AppIDCat",
-        "App_Layer_Protocol": "Alert.65615",
-        "Application_Protocol": "Alert.BIN(9)",
-        "Area": "Alert.65576",
-        "Attacker_IP": "Alert.262175",
-        "Attribute_Type": "Alert.65621",
-        "Authentication_Type": "Alert.65618",
-        "Authoritative_Answer": "Alert.BIN(20)",
-        "AvgSeverity": "Alert.AvgSeverity",
-        "Bcc": "Alert.4259847",
-        "Caller_Process": "Alert.65587",
-        "Catalog_Name": "Alert.65556",
-        "Category": "Alert.65540",
-        "Cc": "Alert.4259846",
-        "Class.Name": "Class.Name",
-        "Class.Priority": "Class.Priority",
-        "Client_Version": "Alert.4259853",
-        "CnC_Host": "Alert.65628",
-        "CommandID": "Alert.BIN(2)",
-        "CommandIDCat": "Alert.CommandIDCat",
-        "Confidence": "Alert.4456458",
-        "Contact_Name": "Alert.BIN(15)",
-        "Contact_Nickname": "Alert.BIN(16)",
-        "Cookie": "Alert.4259850",
-        "Creator_Name": "Alert.65551",
-        "DAT_Version": "Alert.262165",
-        "DB2_Plan_Name": "Alert.65557",
-        "DNS - Class": "Alert.21364737",
-        "DNS - Class_Name": "Alert.38141953",
-        "DNS - Query": "Alert.122028033",
-        "DNS - Response_Code": "Alert.88473601",
-        "DNS - Response_Code_Name": "Alert.105250817",
-        "DNS - Type": "Alert.54919169",
-        "DNS - Type_Name": "Alert.71696385",
-        "DNS_Class": "Alert.BIN(18)",
-        "DNS_Name": "Alert.4259867",
-        "DNS_Server_IP": "Alert.262178",
-        "DNS_Type": "Alert.BIN(17)",
-        "DSID": "Alert.DSID",
-        "DSIDSigID": "Alert.DSIDSigID",
-        "Database_GUID": "Alert.262169",
-        "Database_ID": "Alert.65569",
-        "Database_Name": "Alert.BIN(8)",
-        "Datacenter_ID": "Alert.65602",
-        "Datacenter_Name": "Alert.65603",
-        "Delivery_ID": "Alert.65550",
-        "Description": "Alert.4259873",
-        "Destination_Directory": "Alert.65592",
-        "Destination_Filename": "Alert.4259852",
-        "Destination_Hostname": "Alert.65539",
-        "Destination_Logon_ID": "Alert.65584",
-        "Destination_Network": "Alert.65573",
-        "Destination_UserID": "Alert.65567",
-        "Destination_Zone": "Alert.65542",
-        "Detection_Method": "Alert.65599",
-        "Device_Action": "Alert.65594",
-        "Device_Confidence": "Alert.262179",
-        "Device_IP": "Alert.262154",
-        "Device_Port": "Alert.262155",
-        "Device_URL": "Alert.4259886",
-        "Direction": "Alert.BIN(30)",
-        "Directory": "Alert.65591",
-        "DomainID": "Alert.BIN(3)",
-        "DomainIDCat": "Alert.DomainIDCat",
-        "DstIP": "Alert.DstIP",
-        "DstMac": "Alert.DstMac",
-        "DstPort": "Alert.DstPort",
-        "End_Page": "Alert.4456451",
-        "Engine_List": "Alert.4259887",
-        "EventCount": "Alert.EventCount",
-        "Event_Class": "Alert.65545",
-        "External_Application": "Alert.65552",
-        "External_DB2_Server": "Alert.65553",
-        "External_Device_ID": "Alert.65607",
-        "External_Device_Name": "Alert.65608",
-        "External_Device_Type": "Alert.65606",
-        "External_EventID": "Alert.262156",
-        "External_Hostname": "Alert.65575",
-        "External_SessionID": "Alert.65582",
-        "External_SubEventID": "Alert.262158",
-        "FTP_Command": "Alert.65559",
-        "Facility": "Alert.65577",
-        "File_Hash": "Alert.262159",
-        "File_ID": "Alert.65620",
-        "File_Operation": "Alert.BIN(12)",
-        "File_Operation_Succeeded": "Alert.BIN(13)",
-        "File_Path": "Alert.4259877",
-        "File_Type": "Alert.65558",
-        "Filename": "Alert.4259843",
-        "FirstTime": "Alert.FirstTime",
-        "Flow": "Alert.Flow",
-        "FlowID": "Alert.FlowID",
-        "From": "Alert.4259844",
-        "From_Address": "Alert.4259875",
-        "GUIDDst": "Alert.GUIDDst",
-        "GUIDSrc": "Alert.GUIDSrc",
-        "GeoLoc_ASNGeoDst.Latitude": "GeoLoc_ASNGeoDst.Latitude",  # This is useless
-        "GeoLoc_ASNGeoDst.Longitude": "GeoLoc_ASNGeoDst.Longitude",  # This is useless
-        "GeoLoc_ASNGeoDst.Msg": "GeoLoc_ASNGeoDst.Msg",  # This is useless
-        "GeoLoc_ASNGeoDst.XCoord": "GeoLoc_ASNGeoDst.XCoord",  # This is useless
-        "GeoLoc_ASNGeoDst.YCoord": "GeoLoc_ASNGeoDst.YCoord",  # This is useless
-        "GeoLoc_ASNGeoSrc.Latitude": "GeoLoc_ASNGeoSrc.Latitude",  # This is useless
-        "GeoLoc_ASNGeoSrc.Longitude": "GeoLoc_ASNGeoSrc.Longitude",  # This is useless
-        "GeoLoc_ASNGeoSrc.Msg": "GeoLoc_ASNGeoSrc.Msg",  # This is useless
-        "GeoLoc_ASNGeoSrc.XCoord": "GeoLoc_ASNGeoSrc.XCoord",  # This is useless
-        "GeoLoc_ASNGeoSrc.YCoord": "GeoLoc_ASNGeoSrc.YCoord",  # This is useless
-        "Grid_Master_IP": "Alert.262153",
-        "Group_Name": "Alert.65614",
-        "Handheld_ID": "Alert.262168",
-        "Handle_ID": "Alert.262160",
-        "Hash": "Alert.65624",
-        "Hash_Type": "Alert.65625",
-        "Hops": "Alert.4456459",
-        "HostID": "Alert.BIN(4)",
-        "HostIDCat": "Alert.HostIDCat",
-        "IPS.Name": "IPS.Name",
-        "IPSID": "Alert.IPSID",
-        "IPSIDAlertID": "Alert.IPSIDAlertID",
-        "Incident_ID": "Alert.262173",
-        "Incoming_ID": "Alert.65574",
-        "Instance_GUID": "Alert.262161",
-        "Interface": "Alert.BIN(29)",
-        "Interface_Dest": "Alert.65604",
-        "Job_Name": "Alert.4259854",
-        "Job_Type": "Alert.65560",
-        "LPAR_DB2_Subsystem": "Alert.65562",
-        "Language": "Alert.4259855",
-        "LastTime": "Alert.LastTime",
-        "LastTime_usec": "Alert.LastTime_usec",
-        "Local_User_Name": "Alert.4259860",
-        "Logical_Unit_Name": "Alert.65561",
-        "Logon_Type": "Alert.65580",
-        "Mail_ID": "Alert.65548",
-        "Mailbox": "Alert.65590",
-        "Mainframe_Job_Name": "Alert.65568",
-        "Malware_Insp_Action": "Alert.65570",
-        "Malware_Insp_Result": "Alert.65571",
-        "Management_Server": "Alert.65581",
-        "Message_ID": "Alert.65547",
-        "Message_Text": "Alert.4259842",
-        "Method": "Alert.BIN(11)",
-        "NAT_Details": "Alert.262146",
-        "NTP_Client_Mode": "Alert.BIN(25)",
-        "NTP_Offset_To_Monitor": "Alert.4456457",
-        "NTP_Opcode": "Alert.BIN(28)",
-        "NTP_Request": "Alert.BIN(27)",
-        "NTP_Server_Mode": "Alert.BIN(26)",
-        "New_Reputation - ATD_File": "Alert.54919172",
-        "New_Reputation - GTI_Cert": "Alert.71696388",
-        "New_Reputation - GTI_File": "Alert.21364740",
-        "New_Reputation - TIE_Cert": "Alert.88473604",
-        "New_Reputation - TIE_File": "Alert.38141956",
-        "New_Value": "Alert.4259885",
-        "Num_Copies": "Alert.4456449",
-        "ObjectID": "Alert.BIN(5)",
-        "ObjectIDCat": "Alert.ObjectIDCat",
-        "Object_GUID": "Alert.262176",
-        "Object_Type": "Alert.BIN(10)",
-        "Old_Reputation - ATD_File": "Alert.54919171",
-        "Old_Reputation - GTI_Cert": "Alert.71696387",
-        "Old_Reputation - GTI_File": "Alert.21364739",
-        "Old_Reputation - TIE_Cert": "Alert.88473603",
-        "Old_Reputation - TIE_File": "Alert.38141955",
-        "Old_Value": "Alert.4259884",
-        "Operating_System": "Alert.65579",
-        "Organizational_Unit": "Alert.65605",
-        "PCAP_Name": "Alert.4259881",
-        "PID": "Alert.262152",
-        "Parent_File_Hash": "Alert.262172",
-        "Policy_ID": "Alert.262167",
-        "Policy_Name": "Alert.65544",
-        "Priority": "Alert.4456460",
-        "Privileged_User": "Alert.65578",
-        "Privileges": "Alert.4259879",
-        "Process_Name": "Alert.4259870",
-        "Protocol": "Alert.Protocol",
-        "Query_Response": "Alert.BIN(19)",
-        "Queue_ID": "Alert.196609",
-        "RTMP_Application": "Alert.4259858",
-        "Reason": "Alert.65597",
-        "Recipient_ID": "Alert.65549",
-        "Referer": "Alert.4259851",
-        "Registry - Key": "Alert.21364738",
-        "Registry - Value": "Alert.38141954",
-        "Registry_Key": "Alert.65588",
-        "Registry_Value": "Alert.65589",
-        "RemCaseID": "Alert.RemCaseID",
-        "RemOpenTicketTime": "Alert.RemOpenTicketTime",
-        "Reputation": "Alert.262164",
-        "Reputation_Name": "Alert.65610",
-        "Reputation_Score": "Alert.262171",
-        "Reputation_Server_IP": "Alert.262177",
-        "Request_Type": "Alert.65546",
-        "Response_Code": "Alert.BIN(33)",
-        "Response_Time": "Alert.262145",
-        "Return_Code": "Alert.BIN(34)",
-        "Reviewed": "Alert.Reviewed",
-        "Rule.ID": "Rule.ID",
-        "Rule.NormID": "Rule.NormID",
-        "Rule.msg": "Rule.msg",
-        "Rule_NDSNormSigID.msg": "Rule_NDSNormSigID.msg",
-        "Rule_Name": "Alert.65616",
-        "SHA1": "Alert.65619",
-        "SHA256": "Alert.65630",
-        "SNMP_Error_Code": "Alert.BIN(24)",
-        "SNMP_Item": "Alert.4259868",
-        "SNMP_Item_Type": "Alert.BIN(22)",
-        "SNMP_Operation": "Alert.BIN(21)",
-        "SNMP_Version": "Alert.BIN(23)",
-        "SQL_Command": "Alert.65593",
-        "SQL_Statement": "Alert.4259874",
-        "SWF_URL": "Alert.4259856",
-        "Search_Query": "Alert.4259880",
-        "Security_ID": "Alert.65617",
-        "Sensor_Name": "Alert.BIN(31)",
-        "Sensor_Type": "Alert.BIN(32)",
-        "Sensor_UUID": "Alert.4259869",
-        "Sequence": "Alert.Sequence",
-        "Server_ID": "Alert.262166",
-        "Service_Name": "Alert.65609",
-        "SessionID": "Alert.SessionID",
-        "Session_Status": "Alert.65585",
-        "Severity": "Alert.Severity",
-        "Share_Name": "Alert.65629",
-        "SigID": "Alert.SigID",
-        "Signature_Name": "Alert.65537",
-        "Source_Context": "Alert.4259871",
-        "Source_Logon_ID": "Alert.65583",
-        "Source_Network": "Alert.65572",
-        "Source_UserID": "Alert.65566",
-        "Source_Zone": "Alert.65541",
-        "Spam_Score": "Alert.262157",
-        "SrcIP": "Alert.SrcIP",
-        "SrcMac": "Alert.SrcMac",
-        "SrcPort": "Alert.SrcPort",
-        "Start_Page": "Alert.4456450",
-        "Status": "Alert.65611",
-        "Step_Count": "Alert.65563",
-        "Step_Name": "Alert.65564",
-        "Sub_Status": "Alert.65612",
-        "Subcategory": "Alert.65627",
-        "Subject": "Alert.4259848",
-        "TC_URL": "Alert.4259857",
-        "Table_Name": "Alert.65554",
-        "Target_Class": "Alert.65543",
-        "Target_Context": "Alert.4259872",
-        "Target_Process_Name": "Alert.4259878",
-        "ThirdPartyType.Name": "ThirdPartyType.Name",  # This is useless
-        "Threat_Category": "Alert.65595",
-        "Threat_Handled": "Alert.65596",
-        "Threat_Name": "Alert.65538",
-        "To": "Alert.4259845",
-        "To_Address": "Alert.4259876",
-        "Trusted": "Alert.Trusted",
-        "URL": "Alert.4259841",
-        "URL_Category": "Alert.65586",
-        "UUID": "Alert.262163",
-        "UserFld10Cat": "Alert.UserFld10Cat",
-        "UserFld21Cat": "Alert.UserFld21Cat",
-        "UserFld22Cat": "Alert.UserFld22Cat",
-        "UserFld23Cat": "Alert.UserFld23Cat",
-        "UserFld24Cat": "Alert.UserFld24Cat",
-        "UserFld25Cat": "Alert.UserFld25Cat",
-        "UserFld26Cat": "Alert.UserFld26Cat",
-        "UserFld27Cat": "Alert.UserFld27Cat",
-        "UserFld8Cat": "Alert.UserFld8Cat",
-        "UserFld9Cat": "Alert.UserFld9Cat",
-        "UserIDDst": "Alert.BIN(6)",
-        "UserIDDstCat": "Alert.UserIDDstCat",
-        "UserIDSrc": "Alert.BIN(7)",
-        "UserIDSrcCat": "Alert.UserIDSrcCat",
-        "User_Agent": "Alert.4259849",
-        "User_Nickname": "Alert.BIN(14)",
-        "Users.Name": "Users.Name",  # This is useless
-        "VLan": "Alert.VLan",
-        "VPN_Feature_Name": "Alert.65623",
-        "Version": "Alert.4259859",
-        "Victim_IP": "Alert.262174",
-        "Virtual_Machine_ID": "Alert.65601",
-        "Virtual_Machine_Name": "Alert.65600",
-        "Volume_ID": "Alert.65565",
-        "Vulnerability_References": "Alert.4259882",
-        "Web_Domain": "Alert.65613",
-        "WriteTime": "Alert.WriteTime",
-        "ZoneDst": "Alert.ZoneDst",
-        "ZoneSrc": "Alert.ZoneSrc",
-        "Zone_ZoneDst.Name": "Zone_ZoneDst.Name",  # This is useless
-        "Zone_ZoneSrc.Name": "Zone_ZoneSrc.Name",
-    }  # This is useless
+    SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME = SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME
     """
     Fields name mapping (reversed).  
     """
 
+    # Nickname of the internal names, used by `_build_resolver`
+    _NICKNAMES_BY_INTERNAL_NAME = {
+        internal: nickname
+        for nickname, internal in SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME.items()
+        if nickname != internal
+    }
+
+    # Instance attributes are stored in slots, the instance __dict__ inherited from UserDict is never allocated.
+    # `_row`: Tuple (names, values) of events created with `from_row`, `None` once the data is built.
+    # `_resolver`: Tuple (data, len(data), {name: key}) built by `_build_resolver`, `None` until a nickname is resolved.
+    # Unset slots read as `None`, see `__getattr__`.
+    __slots__ = ("data", "nitro", "_row", "_resolver")
+
+    # EventManager copied by `_new_data_from_id_query`, `None` until `data_from_id` is called with `use_query=True`
+    _data_from_id_template = None
+
     def __init__(self, *args, **kwargs):
         """
         Create a new event representation
@@ -1421,57 +1213,225 @@ class Event(NitroDict):
         """
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def from_row(cls, names, values):
+        """
+        Create a new event from a query result row.  
+
+        The event's data dict is built when the event is first accessed, 
+        events that are never used don't pay the cost of building their data.
+
+        Arguments:
+            - `names` (`tuple[str]`): Columns names as returned by `msiempy.core.utils.parse_query_columns`, shared by all the rows.
+            - `values` (`list[str]`): Row values, in the same order as the columns names.
+        """
+        event = cls.__new__(cls)
+        NitroObject.__init__(event)
+        event._row = (names, values)
+        return event
+
+    def __getattr__(self, name):
+        """
+        Build the data of events created with `from_row` when it's first accessed.  
+        Only called if the attribute is not found the usual way, it does not slow down normal attribute access.
+        """
+        if name == "data":
+            row = self._row
+            if row is not None:
+                self._row = None
+                self.data = dict(zip(*row))
+                return self.data
+        elif name in ("_row", "_resolver"):
+            return None
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def __copy__(self):
+        """
+        Build the data of events created with `from_row` before copying them.
+        """
+        cls = self.__class__
+        inst = cls.__new__(cls)
+        inst.data = self.data.copy()
+        inst.nitro = self.nitro
+        # Attributes set outside the slots
+        inst.__dict__.update(self.__dict__)
+        return inst
+
     def _find_key(self, key):
         """
-        Use the fields name mapping to resolve internal name based on nickname
+        Use the fields name mapping to resolve internal name based on nickname.
+
+        Raises:
+            `KeyError` if the key can't be resolved.
+        """
+        resolved = self._try_find_key(key)
+        if resolved is None:
+            raise KeyError("Dictionnary key not found : {}".format(key))
+        return resolved
+
+    def _try_find_key(self, key):
         """
-        if collections.UserDict.__contains__(self, key):
+        Same as `_find_key` but returns `None` if the key can't be resolved.
+
+        The resolver is only checked against the identity and size of the data dict: 
+        a resolved key that is not in the data anymore, or a name the resolver misses but `_probe_key` resolves,
+        means the keys have been changed on the data dict directly and the resolver is re-built.
+        """
+        data = self.data
+        if key in data:
             return key
-        if (
-            key in self.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME.keys()
-            and collections.UserDict.__contains__(
-                self, self.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME[key]
-            )
-        ):
-            return self.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME[key]
+        resolver = self._resolver
+        if resolver is not None and resolver[0] is data and resolver[1] == len(data):
+            resolved = resolver[2].get(key)
+            if resolved is not None:
+                if resolved in data:
+                    return resolved
+            elif self._probe_key(key) is None:
+                return None
+        return self._build_resolver().get(key)
+
+    def _probe_key(self, key):
+        """
+        Resolve a name that is not a key of the event without the resolver, `None` if it can't be resolved.  
+        Same precedence as `_build_resolver`.
+        """
+        data = self.data
+        mapped = self.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME.get(key)
+        if mapped is not None and mapped in data:
+            return mapped
 
         # Loop thought FIELDS_TABLES and try with table prefix
         # Old behaviour
-        for table in self.FIELDS_TABLES:
-            if collections.UserDict.__contains__(self, table + "." + key):
-                return table + "." + key
-
-        raise KeyError("Dictionnary key not found : {}".format(key))
+        if isinstance(key, str):
+            for table in self.FIELDS_TABLES:
+                prefixed = table + "." + key
+                if prefixed in data:
+                    return prefixed
+        return None
+
+    def _build_resolver(self):
+        """
+        Returns the mapping of all the names that resolve to the event's keys: 
+        the keys themselves, the nicknames (see `SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME`) and the fields without table prefix.  
+
+        Built from the event's keys, nicknames take precedence over the fields without table prefix 
+        and when two tables have the same field, the first table of `FIELDS_TABLES` wins.
+        See `_try_find_key` for when the resolver is re-built.
+        """
+        data = self.data
+        rank_of = self._FIELDS_TABLES_PRIORITY.get
+        max_rank = len(self.FIELDS_TABLES)
+        ranks = dict()
+        names = dict()
+        # Try with table prefix
+        # Old behaviour
+        for full_key in data:
+            if not isinstance(full_key, str):
+                continue
+            table, sep, short = full_key.partition(".")
+            if sep:
+                rank = rank_of(table)
+                if rank is not None and rank < ranks.get(short, max_rank):
+                    ranks[short] = rank
+                    names[short] = full_key
+
+        nickname_of = self._NICKNAMES_BY_INTERNAL_NAME.get
+        for full_key in data:
+            nickname = nickname_of(full_key)
+            if nickname is not None:
+                names[nickname] = full_key
+
+        names.update(zip(data, data))
+        self._resolver = (data, len(data), names)
+        return names
+
+    def _extend_resolver(self, names, full_key):
+        """
+        Add the names of a new key of the event to the resolver built by `_build_resolver`, with the same precedence.
+        """
+        data = self.data
+        names[full_key] = full_key
+        nickname_of = self._NICKNAMES_BY_INTERNAL_NAME.get
+        nickname = nickname_of(full_key)
+        if nickname is not None and nickname not in data:
+            names[nickname] = full_key
+
+        if not isinstance(full_key, str):
+            return
+        table, sep, short = full_key.partition(".")
+        if not sep or short in data:
+            return
+        rank_of = self._FIELDS_TABLES_PRIORITY.get
+        rank = rank_of(table)
+        if rank is None:
+            return
+        current = names.get(short)
+        # Nicknames take precedence, then the first table of FIELDS_TABLES
+        if current is None or (
+            nickname_of(current) != short and rank < rank_of(current.partition(".")[0])
+        ):
+            names[short] = full_key
 
     def __getitem__(self, key):
         """
         Use the fields name mapping to offer better dict usage
         """
-        return collections.UserDict.__getitem__(self, self._find_key(key))
+        data = self.data
+        # Internal names are the common case.
+        # Tested rather than caught: raising a KeyError costs more than the nickname resolution
+        if key in data:
+            return data[key]
+        resolver = self._resolver
+        if resolver is not None and resolver[0] is data and resolver[1] == len(data):
+            resolved = resolver[2].get(key)
+            if resolved is not None and resolved in data:
+                return data[resolved]
+        return data[self._find_key(key)]
     
     def __delitem__(self, key):
         """
         Use the fields name mapping to offer better dict usage
         """
-        return collections.UserDict.__delitem__(self, self._find_key(key))
+        key = self._find_key(key)
+        self._resolver = None
+        del self.data[key]
 
     def __contains__(self, key):
         """
         Use the fields name mapping to offer better dict usage
         """
-        try:
-            return self._find_key(key) != None
-        except KeyError:
-            return False
+        return self._try_find_key(key) is not None
     
     def __setitem__(self, key, value):
         """
         Use the fields name mapping to offer better dict usage
         """
-        try:
-            return collections.UserDict.__setitem__(self, self._find_key(key), value)
-        except KeyError:
-            return collections.UserDict.__setitem__(self, key, value)
+        data = self.data
+        if key in data:
+            data[key] = value
+            return
+        resolver = self._resolver
+        if resolver is not None and resolver[0] is data and resolver[1] == len(data):
+            resolved = self._try_find_key(key)
+            # Might have been re-built
+            resolver = self._resolver
+        else:
+            # Don't build the resolver for every new key while the event is filled
+            resolved = self._probe_key(key)
+            resolver = None
+        if resolved is not None:
+            data[resolved] = value
+            return
+
+        # New key
+        if isinstance(key, str):
+            key = sys.intern(key)
+        data[key] = value
+        if resolver is not None:
+            self._extend_resolver(resolver[2], key)
+            self._resolver = (data, len(data), resolver[2])
 
     def get_id(self):
         """
@@ -1479,15 +1439,14 @@ class Event(NitroDict):
 
         Return the full event ID or `None`.  
         """
-        the_id = (
-            self.data["Alert.IPSIDAlertID"]
-            if ("Alert.IPSIDAlertID" in self.data)
-            else str(self.data["ipsId"]["id"]) + "|" + str(self.data["alertId"])
-            if ("alertId" in self.data)
-            else self.data["eventId"]
-            if ("eventId" in self.data)
-            else None
-        )
+        data = self.data
+        the_id = data.get("Alert.IPSIDAlertID")
+        if the_id is None:
+            alert_id = data.get("alertId")
+            if alert_id is not None:
+                the_id = str(data["ipsId"]["id"]) + "|" + str(alert_id)
+            else:
+                the_id = data.get("eventId")
         if the_id:
             return the_id
         else:
@@ -1507,29 +1466,27 @@ class Event(NitroDict):
             Uses the internal API method `IPS_ADDALERTNOTE`
         """
         the_id = self.get_id()
+        if not isinstance(the_id, str):
+            log.error(
+                "Couldn't set event's note, the event ID hasn't been found. Event: %s",
+                self,
+            )
+            return
 
-        if isinstance(the_id, str):
+        # Notes of 4000 characters or less are sent as is
+        if len(note) > 4000:
+            log.warning(
+                "The note is longer than 4000 characters, only the "
+                "first 4000 characters will be kept. The maximum "
+                "accepted by the SIEM is 4096 characters."
+            )
+            note = note[:4000] + "\n\n--NOTE HAS BEEN TRUNCATED--"
 
-            if len(note) >= 4000:
-                log.warning(
-                    "The note is longer than 4000 characters, only the"
-                    "first 4000 characters will be kept. The maximum"
-                    "accepted by the SIEM is 4096 characters."
-                )
-                note = note[:4000] + "\n\n--NOTE HAS BEEN TRUNCATED--"
+        if not no_date:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            note = timestamp + " - " + note.translate(_NOTE_ESCAPE)
 
-            if no_date == False:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                note = note.replace('"', '\\"').replace("\n", "\\n")
-                note = timestamp + " - " + note
-
-            self.nitro.request("add_note_to_event_int", id=the_id, note=note)
-        else:
-            log.error(
-                "Couldn't set event's note, the event ID hasn't been found. Event: {}".format(
-                    self
-                )
-            )
+        self.nitro.request("add_note_to_event_int", id=the_id, note=note)
 
     def data_from_id(self, id, use_query=False, extra_fields=[]):
         """
@@ -1543,39 +1500,134 @@ class Event(NitroDict):
         """
 
         if use_query == True:
-            f = FieldFilter("IPSIDAlertID", id, operator="EQUALS")
-            e = EventManager(
-                time_range="CUSTOM",
-                start_time=datetime.now() - timedelta(days=365),
-                end_time=datetime.now() + timedelta(days=1),
-                filters=[f],
-                fields=extra_fields,
-                limit=2,
-            )
-            try:
-                e.load_data()
-            except NitroError:
-                log.error(
-                    "Query failed, can't load event's data from id with 1 year timerange, looking at the last 45 days only..."
-                )
-                e.start_time = datetime.now() - timedelta(days=45)
-                e.load_data()
+            e = self._new_data_from_id_query(id, extra_fields)
+            self._load_data_from_id_query(e, id)
 
             if len(e) == 1:
                 return e[0]
             else:
                 raise NitroError(
-                    "Could not load event : "
-                    + str(id)
-                    + " from query :"
-                    + str(e.__dict__)
-                    + ". Try with use_query=False."
+                    "Could not load event : {!r} from query, {} events found with filters={!r}, time_range={!r}. Try with use_query=False.".format(
+                        id, len(e), e.filters, e.time_range
+                    )
                 )
 
         elif use_query == False:
             return self.nitro.request("get_alert_data", id=id)
 
-    def refresh(self, use_query=None, extra_fields=None):
+    @classmethod
+    def data_from_ids(cls, ids, use_query=False, extra_fields=None, max_concurrency=8):
+        """
+        Load the data of several events.  
+
+        Arguments:
+            - `ids` (`list[str]`): The events IDs.
+            - `use_query` (`bool`): Uses one query to retreive common data of all the events. Only works with SIEM 11.2 or greater.
+                Default behaviour will call ``ipsGetAlertData`` for every event, `max_concurrency` requests at a time.
+            - `extra_fields` (`list`): Only when `use_query=True`. Additionnal event fields to load in the query.
+            - `max_concurrency` (`int`): Maximum number of concurrent ``ipsGetAlertData`` requests.
+
+        Returns:
+            `dict` of the events data by ID. With `use_query=True`, the IDs not found by the query are missing.
+
+        Raises:
+            `NitroError` if the query finds several events with the same ID.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return dict()
+
+        if use_query == True:
+            return cls._data_from_ids_query(ids, extra_fields)[1]
+
+        else:
+            nitro = NitroSession()
+            nitro._ensure_pool_size(max_concurrency)
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_concurrency
+            ) as executor:
+                results = executor.map(
+                    lambda the_id: nitro.request("get_alert_data", id=the_id), ids
+                )
+                return dict(zip(ids, results))
+
+    @classmethod
+    def _data_from_ids_query(cls, ids, extra_fields):
+        """
+        Load the events with one query, see `data_from_ids`.
+
+        Returns:
+            `tuple(EventManager, dict)`: The loaded query and the events by ID.
+        """
+        e = cls._new_data_from_id_query(ids, extra_fields)
+        cls._load_data_from_id_query(e, ids)
+
+        loaded = dict()
+        duplicates = []
+        for event in e:
+            the_id = event.get_id()
+            if the_id in loaded:
+                duplicates.append(the_id)
+            loaded[the_id] = event
+        if duplicates:
+            raise NitroError(
+                "Could not load event : {!r} from query, {} events found with filters={!r}, time_range={!r}. Try with use_query=False.".format(
+                    list(dict.fromkeys(duplicates)), len(e), e.filters, e.time_range
+                )
+            )
+        return (e, loaded)
+
+    @staticmethod
+    def _load_data_from_id_query(e, id):
+        """
+        Load the `EventManager` query returned by `_new_data_from_id_query`, 
+        falls back to the last 45 days if the query over the last year fails.
+        """
+        try:
+            e.load_data()
+        except NitroError:
+            log.error(
+                "Query failed, can't load event's data from id %s with 1 year timerange, looking at the last 45 days only...",
+                id,
+            )
+            e.start_time = datetime.now() - timedelta(days=45)
+            e.load_data()
+
+    @classmethod
+    def _new_data_from_id_query(cls, id, extra_fields):
+        """
+        Returns a new `EventManager` query for the event ID, or the list of events IDs, over the last year.  
+
+        The queries are copied from a template query built once, 
+        the SIEM formatted default fields are shared by all the queries without extra fields.
+        """
+        template = Event._data_from_id_template
+        if template is None:
+            template = Event._data_from_id_template = EventManager(
+                time_range="CUSTOM", limit=2
+            )
+            # Computed once, copied with the template
+            template._get_fields_payload()
+
+        e = copy.copy(template)
+        e.data = []
+        e._filters = []
+        e._filters_payload = None
+        e._parse_desc_cache = {}
+        if isinstance(id, list):
+            e.add_filter(FieldFilter("IPSIDAlertID", id, operator="IN"))
+            # One row per event, one more to notice duplicates like with a single ID
+            e.limit = len(id) + 1
+        else:
+            e.add_filter(FieldFilter("IPSIDAlertID", id, operator="EQUALS"))
+        if extra_fields:
+            e.fields = EventManager._with_default_fields(extra_fields)
+        now = datetime.now()
+        e.start_time = now - timedelta(days=365)
+        e.end_time = now + timedelta(days=1)
+        return e
+
+    def refresh(self, use_query=None, extra_fields=None, only_if_changed=False):
         """
         Re-load event's data.
 
@@ -1584,6 +1636,9 @@ class Event(NitroDict):
                 In contrario, if explicitly `False`, force the use of ``ipsGetAlertData`` to get the details.
                 Default behaviour will use the query module if an ``'Alert.IPSIDAlertID'`` keys exists.  
             - `extra_fields` (`list`): Only when `use_query=True` or the Event is already a query event. Additionnal event fields to load in the query.
+            - `only_if_changed` (`bool`): Only when the Event is already a query event and `use_query` is not specified. 
+                Filter the query on the event's ``'Alert.LastTime'`` so the SIEM returns no rows if the event hasn't changed since it was loaded, the data is kept as is then.
+                The value is used as returned by the queries: ``"MM/DD/YYYY HH:MM:SS"``, i.e. ``"10/03/2019 11:52:22"``.
 
         Warning:
             Enforce `use_query=True` will reset the Events fields to whatever is passed to `extra_fields`
@@ -1596,17 +1651,24 @@ class Event(NitroDict):
                 "Can't refresh a Event without an ID: {}".format(self.data)
             )
         if use_query == None:
-            if "Alert.IPSIDAlertID" in self.data.keys():
+            if "Alert.IPSIDAlertID" in self.data:
                 # ensure to re-use the query module if that's the case
-                self.data.update(
-                    self.data_from_id(
-                        self.data["Alert.IPSIDAlertID"],
-                        use_query=True,
-                        extra_fields=self.data.keys() + extra_fields
-                        if extra_fields
-                        else [],
+                # Load the event's fields and the extra fields, without duplicates
+                fields = list(self.data)
+                if extra_fields:
+                    fields.extend(extra_fields)
+                    fields = list(dict.fromkeys(fields))
+                last_time = self.data.get("Alert.LastTime") if only_if_changed else None
+                if last_time:
+                    self._refresh_if_changed(fields, last_time)
+                else:
+                    self.data.update(
+                        self.data_from_id(
+                            self.data["Alert.IPSIDAlertID"],
+                            use_query=True,
+                            extra_fields=fields,
+                        )
                     )
-                )
             else:
                 the_id = self.get_id()
                 self.data.update(self.data_from_id(the_id))
@@ -1622,6 +1684,91 @@ class Event(NitroDict):
             the_id = self.get_id()
             self.data.update(self.data_from_id(the_id))
 
+    def _refresh_if_changed(self, fields, last_time):
+        """
+        Re-load the query event's data if it has changed since `last_time`, see `refresh`.
+
+        Arguments:
+            - `fields` (`list`): Event fields to load in the query.
+            - `last_time` (`str`): ``'Alert.LastTime'`` value in the queries result format: ``"MM/DD/YYYY HH:MM:SS"``. 
+                Passed as is as a ``GREATER_THAN`` filter value.
+        """
+        the_id = self.data["Alert.IPSIDAlertID"]
+        e = self._new_data_from_id_query(the_id, fields)
+        e.add_filter(FieldFilter("LastTime", [last_time], operator="GREATER_THAN"))
+        self._load_data_from_id_query(e, the_id)
+
+        # No rows: the event hasn't changed
+        if len(e) == 1:
+            self.data.update(e[0])
+        elif len(e) > 1:
+            raise NitroError(
+                "Could not load event : {!r} from query, {} events found with filters={!r}, time_range={!r}. Try with use_query=False.".format(
+                    the_id, len(e), e.filters, e.time_range
+                )
+            )
+
+
+def refresh_events(events, use_query=None, extra_fields=None, max_concurrency=8):
+    """
+    Re-load the data of events. Same as calling `Event.refresh` on every event, 
+    but the query events are loaded with one query and the others with concurrent ``ipsGetAlertData`` requests (see `Event.data_from_ids`).
+
+    Arguments:
+        - `events` (`list[Event]`): Events to refresh, an `EventManager` for instance.
+        - `use_query` (`bool`): See `Event.refresh`.
+        - `extra_fields` (`list`): See `Event.refresh`.
+        - `max_concurrency` (`int`): Maximum number of concurrent ``ipsGetAlertData`` requests.
+
+    Raises:
+        `AttributeError` if an event ID has not been found. `NitroError` if an event could not be loaded from the query.
+        The events are updated only once all of them are loaded, no event is updated if an error is raised.
+    """
+    query_events = []
+    other_events = []
+    for event in events:
+        if not event.get_id():
+            raise AttributeError(
+                "Can't refresh a Event without an ID: {}".format(event.data)
+            )
+        if use_query or (use_query == None and "Alert.IPSIDAlertID" in event.data):
+            query_events.append(event)
+        else:
+            other_events.append(event)
+
+    query_loaded = dict()
+    if query_events:
+        # Load the events fields like Event.refresh, and the extra fields, without duplicates
+        fields = []
+        if use_query == None:
+            for event in query_events:
+                fields.extend(event.data)
+        if extra_fields:
+            fields.extend(extra_fields)
+        fields = list(dict.fromkeys(fields))
+
+        ids = list(dict.fromkeys(event.get_id() for event in query_events))
+        e, query_loaded = Event._data_from_ids_query(ids, fields)
+        missing = [the_id for the_id in ids if the_id not in query_loaded]
+        if missing:
+            raise NitroError(
+                "Could not load event : {!r} from query, {} events found with filters={!r}, time_range={!r}. Try with use_query=False.".format(
+                    missing, len(e), e.filters, e.time_range
+                )
+            )
+
+    other_loaded = dict()
+    if other_events:
+        other_loaded = Event.data_from_ids(
+            [event.get_id() for event in other_events],
+            max_concurrency=max_concurrency,
+        )
+
+    for event in query_events:
+        event.data.update(query_loaded[event.get_id()])
+    for event in other_events:
+        event.data.update(other_loaded[event.get_id()])
+
 
 class GroupedEvent(Event):
     """
@@ -1646,17 +1793,37 @@ class GroupedEvent(Event):
 
     """
 
-    SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME = (
-        Event.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME
+    __slots__ = ()
+
+    SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME = types.MappingProxyType(
+        dict(
+            Event.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME,
+            Count="COUNT(*)",
+            TotalEventCount="SUM(Alert.EventCount)",
+        )
+    )
+
+    _NICKNAMES_BY_INTERNAL_NAME = dict(
+        Event._NICKNAMES_BY_INTERNAL_NAME,
+        **{"COUNT(*)": "Count", "SUM(Alert.EventCount)": "TotalEventCount"}
     )
-    SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME["Count"] = "COUNT(*)"
-    SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME[
-        "TotalEventCount"
-    ] = "SUM(Alert.EventCount)"
 
 
-class _QueryFilter(collections.UserDict):
-    """Base class for all SIEM query objects in order to dump the filter as dict."""
+class _QueryFilter(dict):
+    """Base class for all SIEM query objects in order to dump the filter as dict.  
+
+    Filters are `dict` objects in the SIEM API format.
+    """
+
+    __slots__ = ()
+
+    def _get_data(self):
+        return self
+
+    data = property(fget=_get_data)
+    """
+    The filter itself. Filters used to wrap a ``data`` dict, kept for backward compatibility.
+    """
 
 
 class GroupFilter(_QueryFilter):
@@ -1671,22 +1838,23 @@ class GroupFilter(_QueryFilter):
         Object `FieldFilter`
     """
 
+    __slots__ = ()
+
     def __init__(self, filters, logic="AND"):
         """
         Create a new group filter
 
         Arguments:
-            - `filters` (`list`): a list of filters. Filters can be `msiempy.FieldFilter` or `msiempy.GroupFilter`
+            - `filters` (`list`): a list of filters. Filters can be `msiempy.FieldFilter` or `msiempy.GroupFilter`. 
+                The group refers to the filters, later changes to the filters are reflected in the group.
             - `logic` (`str`): ``"AND"`` or ``"OR"``
         """
-        super().__init__()
-
-        # Declaring attributes
-        self.data = {
-            "type": "EsmFilterGroup",
-            "filters": [dict(f) for f in filters],
-            "logic": logic,
-        }
+        super().__init__(
+            type="EsmFilterGroup",
+            # Filter objects and dicts are shared, not copied
+            filters=[f if isinstance(f, dict) else dict(f) for f in filters],
+            logic=logic,
+        )
 
 
 class FieldFilter(_QueryFilter):
@@ -1954,8 +2122,18 @@ class FieldFilter(_QueryFilter):
         "DstMac",
         "LastTime",
     ]
+    DOCUMENTED_FILTERS = [sys.intern(name) for name in DOCUMENTED_FILTERS]
     """ List fo documented filter names, show a warning if trying to filter on a unknown filter name """
 
+    # Filters attributes are stored in slots, filters have no instance __dict__
+    __slots__ = ("_operator", "_values", "name")
+
+    # Set of the documented filter names for fast membership tests
+    _DOCUMENTED_FILTERS_SET = frozenset(DOCUMENTED_FILTERS)
+
+    # Undocumented filter names already warned about
+    _WARNED_NAMES = set()
+
     def __init__(self, name, values, operator="IN"):
         """
         Create a new field filter for a query.  
@@ -1968,31 +2146,90 @@ class FieldFilter(_QueryFilter):
         super().__init__()
 
         # Declaring attributes
-        self._operator = str()
+        # The operator is checked here rather than through the operator property
+        if not (isinstance(operator, str) and operator in self._POSSIBLE_OPERATORS_SET):
+            self._set_operator(operator)
+        self._operator = operator
         self._values = list()
 
-        self.operator = operator
         self.values = values
 
+        # Interned like the documented filter names, the lookups below compare by identity
+        if isinstance(name, str):
+            name = sys.intern(name)
+
         self.name = name
         """
         Name of the field
         """
 
-        self.data = {
-            "type": "EsmFieldFilter",
-            "field": {"name": self.name},
-            "operator": self.operator,
-            "values": self.values,
-        }
+        self.update(
+            type="EsmFieldFilter",
+            field={"name": name},
+            operator=self.operator,
+            values=self.values,
+        )
 
         # check the name against the list of possible filters and log warning if not present.
-        if name not in FieldFilter.DOCUMENTED_FILTERS:
-            log.warning(
-                "You're using an undocumented filter name: '{name}'.  ".format(
-                    name=name
+        # Only once per name
+        if (
+            name not in FieldFilter._DOCUMENTED_FILTERS_SET
+            and name not in FieldFilter._WARNED_NAMES
+        ):
+            FieldFilter._WARNED_NAMES.add(name)
+            log.warning("You're using an undocumented filter name: '%s'.  ", name)
+
+    @classmethod
+    def basic(cls, name, values, operator="IN"):
+        """
+        Create a new field filter with ``EsmBasicValue`` values only.  
+
+        Faster than the constructor for many values: the `str` values are not type checked 
+        and the name is not checked against `DOCUMENTED_FILTERS`.
+
+        Arguments:
+            - `name` (`str`): field name. Example : ``"SrcIP"``.
+            - `values` (`list`): list of `str`, `int` or `float` values, or a single value.
+            - `operator` (`str`): See `FieldFilter`.
+
+        Raises:
+            `TypeError` if a value is not a `str`, `int` or `float`. Use the constructor for other value types.
+
+        Example::
+
+            filter = FieldFilter.basic('SrcIP', ['10.5.0.0/16', '10.6.0.0/16'])
+        """
+        f = cls.__new__(cls)
+        f.operator = operator
+        if not isinstance(values, list):
+            values = [values]
+        f._values = [
+            {"type": "EsmBasicValue", "value": v if type(v) is str else cls._basic_str(v)}
+            for v in values
+        ]
+        if isinstance(name, str):
+            name = sys.intern(name)
+        f.name = name
+        f.update(
+            type="EsmFieldFilter",
+            field={"name": name},
+            operator=f._operator,
+            values=f._values,
+        )
+        return f
+
+    @staticmethod
+    def _basic_str(value):
+        """
+        Returns the string of a `int` or `float` value for `basic`.
+        """
+        if not isinstance(value, (int, float, str)):
+            raise TypeError(
+                "Invalid basic filter value, must be a int, float or str. Not {!r}".format(
+                    value
                 )
             )
+        return str(value)
 
     POSSIBLE_OPERATORS = [
         "IN",
@@ -2011,6 +2248,9 @@ class FieldFilter(_QueryFilter):
     ]
     """List of possibles operators"""
 
+    # Set of the possible operators for fast membership tests
+    _POSSIBLE_OPERATORS_SET = frozenset(POSSIBLE_OPERATORS)
+
     POSSIBLE_VALUE_TYPES = [
         {"type": "EsmWatchlistValue", "key": "watchlist"},
         {"type": "EsmVariableValue", "key": "variable"},
@@ -2021,11 +2261,17 @@ class FieldFilter(_QueryFilter):
     List of possible value type. See `add_value`.
     """
 
+    # Python types of the values added as ``EsmBasicValue`` by `values` setter
+    _BASIC_VALUE_PYTHON_TYPES = frozenset((str, int, float))
+
+    # Possible value types by type name
+    _VALUE_TYPE_BY_NAME = {vt["type"]: vt for vt in POSSIBLE_VALUE_TYPES}
+
     def _get_operator(self):
         return self._operator
 
     def _set_operator(self, operator):
-        if operator in self.POSSIBLE_OPERATORS:
+        if isinstance(operator, str) and operator in self._POSSIBLE_OPERATORS_SET:
             self._operator = operator
         else:
             raise AttributeError(
@@ -2045,28 +2291,25 @@ class FieldFilter(_QueryFilter):
         return self._values
 
     def _set_values(self, values):
-        if isinstance(values, list):
+        if not isinstance(values, list):
+            values = [values]
 
-            for val in values:
-                if isinstance(val, dict):
-                    self.add_value(**val)
+        append_basic = self._append_basic_fast
+        for val in values:
+            # Basic values are the common case, appended without going through add_value
+            if type(val) in self._BASIC_VALUE_PYTHON_TYPES:
+                append_basic(val)
 
-                elif isinstance(val, (int, float, str)):
-                    self.add_basic_value(val)
+            elif isinstance(val, dict):
+                self.add_value(**val)
 
-                else:
-                    raise TypeError(
-                        "Invalid filter type, must be a list, int, float or str"
-                    )
+            elif isinstance(val, (int, float, str)):
+                append_basic(val)
 
-        elif isinstance(values, dict):
-            self.add_value(**values)
-
-        elif isinstance(values, (int, float, str)):
-            self.add_basic_value(values)
-
-        else:
-            raise TypeError("Invalid filter type, must be a list, int, float or str")
+            else:
+                raise TypeError(
+                    "Invalid filter type, must be a list, int, float or str"
+                )
     
     values = property(fget=_get_values, fset=_set_values)
     """
@@ -2096,57 +2339,59 @@ class FieldFilter(_QueryFilter):
             - `values` (`list`): If ``type`` is ``"EsmCompoundValue"``
 
         Raises: 
-            `KeyError` or `AttributeError` if you don't respect the correct type/key/value combo.
+            `AttributeError` if you don't respect the correct type/key/value combo.
 
         Note: 
             Filtering query with other type of filter than ``EsmBasicValue`` is not tested.
         """
-        try:
-            type_template = None
-
-            # Look for the type of the object ex EsmBasicValue
-            # it' used to know the type and name of value parameter we should receive next
-            for possible_value_type in self.POSSIBLE_VALUE_TYPES:
-                if possible_value_type["type"] == type:
-                    type_template = possible_value_type
-                    if type != "EsmBasicValue":
-                        log.warning(
-                            "Filtering query with other type of filter than 'EsmBasicValue' is not tested."
-                        )
-                    break
-
-            # Error throwing
-            if type_template != None:
-                if type_template["key"] in kwargs:
+        # Look for the type of the object ex EsmBasicValue
+        # it' used to know the type and name of value parameter we should receive next
+        type_template = self._VALUE_TYPE_BY_NAME.get(type)
+        if type_template == None:
+            raise self._invalid_value_error(type, kwargs, "Impossible filter")
 
-                    # Adds a new value to a fields filter
-                    # Filtering query with other type of filter than 'EsmBasicValue' is not tested.
-                    value = kwargs[type_template["key"]]
-                    if type == "EsmBasicValue":
-                        value = str(value)
-                        # log.debug('Adding a basic value to filter ('+self.text+') : '+value)
-                    self._values.append({"type": type, type_template["key"]: value})
-                    # log.debug('The value was appended to the list: '+str(self))
+        key = type_template["key"]
+        if key not in kwargs:
+            raise self._invalid_value_error(
+                type, kwargs, "The valid key value argument is not present"
+            )
 
-                # Error throwing
-                else:
-                    raise KeyError("The valid key value argument is not present")
-            else:
-                raise KeyError("Impossible filter")
-        except KeyError as err:
-            raise AttributeError(
-                "You must provide a valid named Arguments containing the type and values for this filter. The type/keys must be in "
-                + str(self.POSSIBLE_VALUE_TYPES)
-                + "Can't be type="
-                + str(type)
-                + " "
-                + str(kwargs)
-                + ". Additionnal indicator :"
-                + str(err)
+        # Adds a new value to a fields filter
+        # Filtering query with other type of filter than 'EsmBasicValue' is not tested.
+        value = kwargs[key]
+        if type == "EsmBasicValue":
+            value = str(value)
+        else:
+            log.warning(
+                "Filtering query with other type of filter than 'EsmBasicValue' is not tested."
             )
+        self._values.append({"type": type, key: value})
+
+    def _invalid_value_error(self, type, kwargs, indicator):
+        """
+        Returns the `AttributeError` raised by `add_value`.
+        """
+        return AttributeError(
+            "You must provide a valid named Arguments containing the type and values for this filter. The type/keys must be in "
+            + str(self.POSSIBLE_VALUE_TYPES)
+            + "Can't be type="
+            + str(type)
+            + " "
+            + str(kwargs)
+            + ". Additionnal indicator :"
+            + repr(indicator)
+        )
 
     def add_basic_value(self, value):
         """
-        Wrapper arround `add_value` method to simply add a ``EsmBasicValue``.
+        Same as `add_value` method with ``type="EsmBasicValue"``, to simply add a ``EsmBasicValue``.
         """
-        self.add_value(type="EsmBasicValue", value=value)
+        self._append_basic_fast(value)
+
+    def _append_basic_fast(self, value):
+        """
+        Append a ``EsmBasicValue`` to the values, without the type checks of `add_value`.
+        """
+        self._values.append(
+            {"type": "EsmBasicValue", "value": value if type(value) is str else str(value)}
+        )
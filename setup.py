@@ -24,6 +24,7 @@ setup(
     maintainer_email=about['__author_email__'],
     version=about['__version__'],
     packages=find_packages(exclude='tests',),
+    package_data={'msiempy': ['event_fields.json']},
     install_requires=REQUIREMENTS,
     license=about['__license__'],
     long_description=README,
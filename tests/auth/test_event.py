@@ -198,6 +198,56 @@ class T(unittest.TestCase):
                 "The doesn't seem to have been added to the event \n" + str(event),
             )
 
+    def test_refresh_all(self):
+
+        events = EventManager(
+            time_range="CUSTOM",
+            start_time=datetime.now() - timedelta(days=QUERY_TIMERANGE),
+            end_time=datetime.now() + timedelta(days=1),
+            limit=3,
+        )
+        events.load_data()
+
+        events.refresh_all(use_query=False)
+        for event in events:
+            self.assertEqual(
+                event.get_id(),
+                str(event["ipsId"]["id"]) + "|" + str(event["alertId"]),
+            )
+
+        if NitroSession().api_v == 2:
+            events.refresh_all(extra_fields=["SrcIP"])
+            for event in events:
+                self.assertIn("SrcIP", event)
+
+    def test_refresh_if_changed(self):
+        if NitroSession().api_v != 2:
+            self.skipTest("Requires the query module")
+
+        events = EventManager(
+            time_range="CUSTOM",
+            start_time=datetime.now() - timedelta(days=QUERY_TIMERANGE),
+            end_time=datetime.now() + timedelta(days=1),
+            limit=1,
+        )
+        events.load_data()
+        event = events[0]
+        self.assertRegex(
+            event["Alert.LastTime"], r"^\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}$"
+        )
+
+        # The event hasn't changed, the ESM returns no rows
+        data = dict(event.data)
+        event.refresh(only_if_changed=True)
+        self.assertEqual(dict(event.data), data)
+        event.refresh(only_if_changed=True)
+        self.assertEqual(dict(event.data), data)
+
+        # The LastTime filter is applied: an older LastTime is re-loaded
+        event.data["Alert.LastTime"] = "01/01/2000 00:00:00"
+        event.refresh(only_if_changed=True)
+        self.assertEqual(event["Alert.LastTime"], data["Alert.LastTime"])
+
     def test_getitem(self):
         events = EventManager(
             time_range="CUSTOM",
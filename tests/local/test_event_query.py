@@ -0,0 +1,123 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from msiempy.event import Event, EventManager
+
+
+class FakeNitro(object):
+    """Serves the ``query_result`` pages of a result of ``total`` rows and records the requests."""
+
+    def __init__(self, total):
+        self.total = total
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def request(self, request, startPos=0, numRows=500, resultID=None):
+        with self.lock:
+            self.requests.append((startPos, numRows))
+        return {
+            "columns": [{"name": "Alert.IPSIDAlertID"}],
+            "rows": [
+                {"values": [str(i)]}
+                for i in range(startPos, min(startPos + numRows, self.total))
+            ],
+        }
+
+
+class T(unittest.TestCase):
+    def get_events(self, total, num_rows):
+        em = EventManager()
+        em.nitro = FakeNitro(total)
+        events = em._get_events("1", numRows=num_rows, chunk_size=100, workers=3)
+        self.assertEqual(
+            [event["Alert.IPSIDAlertID"] for event in events],
+            [str(i) for i in range(min(total, num_rows))],
+        )
+        return sorted(em.nitro.requests)
+
+    def test_pages_exact(self):
+        self.assertEqual(self.get_events(300, 300), [(0, 100), (100, 100), (200, 100)])
+
+    def test_pages_over_limit(self):
+        self.assertEqual(
+            self.get_events(1000, 250), [(0, 100), (100, 100), (200, 50)]
+        )
+
+    def test_pages_empty(self):
+        self.assertEqual(self.get_events(0, 1000), [(0, 100)])
+
+    def test_pages_short(self):
+        requests = self.get_events(250, 10000)
+        self.assertEqual(requests[:3], [(0, 100), (100, 100), (200, 100)])
+        # At most workers pages requested ahead of the short page
+        self.assertLessEqual(len(requests), 3 + 2)
+
+
+def load_slot(query, *args, **kwargs):
+    """``_qry_load_data`` stub: queries over more than 4 hours are not completed, the first slots return last."""
+    start, end = query._start_time, query._end_time
+    time.sleep((datetime(2020, 1, 2) - start.replace(tzinfo=None)).total_seconds() / 1e6)
+    return ([Event(adict={"start": start, "end": end})], end - start <= timedelta(hours=4))
+
+
+class TSubQueries(unittest.TestCase):
+    def load(self, max_query_depth):
+        em = EventManager(
+            time_range="CUSTOM",
+            start_time="2020-01-01T00:00:00",
+            end_time="2020-01-02T00:00:00",
+        )
+        with mock.patch.object(EventManager, "_qry_load_data", load_slot):
+            em.load_data(slots=4, workers=3, max_query_depth=max_query_depth)
+        return em
+
+    def assertContiguous(self, em, count):
+        self.assertEqual(len(em), count)
+        self.assertEqual(em[-1]["end"] - em[0]["start"], timedelta(days=1))
+        for previous, event in zip(em, em[1:]):
+            self.assertEqual(previous["end"], event["start"])
+
+    def test_sub_queries_order(self):
+        em = self.load(max_query_depth=2)
+        # 4 slots of 6 hours, each divided in 4 slots of 1.5 hours
+        self.assertContiguous(em, 16)
+        self.assertFalse(em.not_completed)
+
+    def test_sub_queries_depth(self):
+        em = self.load(max_query_depth=1)
+        # The 6 hours slots are not divided again
+        self.assertContiguous(em, 4)
+        self.assertTrue(em.not_completed)
+
+    def test_sub_queries_no_depth(self):
+        em = self.load(max_query_depth=0)
+        self.assertContiguous(em, 1)
+        self.assertTrue(em.not_completed)
+
+
+class TRefresh(unittest.TestCase):
+    def refresh_fields(self, extra_fields=None):
+        requested = []
+
+        def data_from_id(event, id, use_query=False, extra_fields=[]):
+            requested.append((id, use_query, extra_fields))
+            return {"Rule.msg": "refreshed"}
+
+        event = Event(adict={"Alert.IPSIDAlertID": "1|2", "Rule.msg": "unknown event"})
+        with mock.patch.object(Event, "data_from_id", data_from_id):
+            event.refresh(extra_fields=extra_fields)
+        self.assertEqual(event["msg"], "refreshed")
+        self.assertEqual(len(requested), 1)
+        self.assertEqual(requested[0][:2], ("1|2", True))
+        return requested[0][2]
+
+    def test_refresh_fields(self):
+        self.assertEqual(self.refresh_fields(), ["Alert.IPSIDAlertID", "Rule.msg"])
+
+    def test_refresh_extra_fields(self):
+        self.assertEqual(
+            self.refresh_fields(["SrcIP", "Rule.msg", "DstIP", "SrcIP"]),
+            ["Alert.IPSIDAlertID", "Rule.msg", "SrcIP", "DstIP"],
+        )
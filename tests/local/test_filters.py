@@ -0,0 +1,62 @@
+import ast
+import unittest
+from msiempy.event import EventManager, FieldFilter, GroupFilter
+
+
+class T(unittest.TestCase):
+    def test_field_filter(self):
+        f = FieldFilter("SrcIP", ["10.0.0.0/8", 22, {"type": "EsmBasicValue", "value": 1}])
+        self.assertEqual(
+            f,
+            {
+                "type": "EsmFieldFilter",
+                "field": {"name": "SrcIP"},
+                "operator": "IN",
+                "values": [
+                    {"type": "EsmBasicValue", "value": "10.0.0.0/8"},
+                    {"type": "EsmBasicValue", "value": "22"},
+                    {"type": "EsmBasicValue", "value": "1"},
+                ],
+            },
+        )
+        with self.assertRaises(AttributeError):
+            f.add_value(type="EsmBasicValue", watchlist=1)
+        with self.assertRaises(AttributeError):
+            FieldFilter("SrcIP", ["10.0.0.0/8"], operator="LIKE")
+
+    def test_field_not_shared(self):
+        f1 = FieldFilter("SrcIP", ["10.0.0.1"])
+        f2 = FieldFilter.basic("SrcIP", ["10.0.0.2"])
+        f1["field"]["name"] = "DstIP"
+        self.assertEqual(f2["field"], {"name": "SrcIP"})
+        self.assertEqual(FieldFilter("SrcIP", ["10.0.0.3"])["field"], {"name": "SrcIP"})
+
+    def test_basic(self):
+        self.assertEqual(
+            FieldFilter.basic("DstIP", ["10.0.0.0/8", 22], operator="NOT_IN"),
+            FieldFilter("DstIP", ["10.0.0.0/8", 22], operator="NOT_IN"),
+        )
+        with self.assertRaises(AttributeError):
+            FieldFilter.basic("DstIP", ["10.0.0.0/8"], operator="LIKE")
+        # Single values are not iterated
+        self.assertEqual(
+            FieldFilter.basic("SrcIP", "10.0.0.1"), FieldFilter("SrcIP", "10.0.0.1")
+        )
+        self.assertEqual(FieldFilter.basic("DstPort", 22), FieldFilter("DstPort", 22))
+        with self.assertRaises(TypeError):
+            FieldFilter.basic("DstIP", [{"type": "EsmWatchlistValue", "watchlist": 42}])
+        with self.assertRaises(TypeError):
+            FieldFilter.basic("DstIP", {"type": "EsmBasicValue", "value": "10.0.0.1"})
+
+    def test_filters_payload(self):
+        # The request templates evaluate the filters repr as literals
+        em = EventManager(
+            filters=[
+                ("SrcIP", ["10.0.0.0/8"]),
+                GroupFilter(
+                    [FieldFilter("DstIP", ["10.0.0.1"]), FieldFilter.basic("DstPort", [22])],
+                    logic="OR",
+                ),
+            ]
+        )
+        self.assertEqual(ast.literal_eval(repr(em.filters)), em.filters)
@@ -45,6 +45,48 @@ class T(unittest.TestCase):
             + event.get("LastTime")
         )
 
+    def test_from_row(self):
+        names = tuple(T.TEST_EVENTS[0].keys())
+        event = Event.from_row(names, list(T.TEST_EVENTS[0].values()))
+        self.assertEqual(event["SrcIP"], "22.22.24.22")
+        self.assertIn("DstIP", event)
+        self.assertEqual(dict(event), T.TEST_EVENTS[0])
+
+    def test_resolved_keys_follow_changes(self):
+        event = Event(adict=dict(T.TEST_EVENTS[0]))
+        self.assertEqual(event["msg"], "unknown event")
+        event["Alert.msg"] = "alert message"
+        self.assertEqual(event["msg"], "alert message")
+        del event["Alert.msg"]
+        self.assertEqual(event["msg"], "unknown event")
+
+    def test_resolved_keys_follow_data_changes(self):
+        event = Event(adict={"Alert.SrcIP": "1", "Rule.msg": "unknown event"})
+        self.assertIn("SrcIP", event)
+        # Same size key swap on the underlying dict
+        event.data.pop("Alert.SrcIP")
+        event.data["Alert.DstIP"] = "2"
+        self.assertIn("DstIP", event)
+        self.assertNotIn("SrcIP", event)
+        self.assertEqual(event["DstIP"], "2")
+        with self.assertRaises(KeyError):
+            event["SrcIP"]
+
+    def test_resolver_extended_with_new_keys(self):
+        # Filling an event does not build the resolver for every new key
+        event = Event(adict=dict(T.TEST_EVENTS[0]))
+        self.assertIsNone(event._resolver)
+        self.assertEqual(event["SrcIP"], "22.22.24.22")
+        names = event._resolver[2]
+        event["Alert.msg"] = "alert message"
+        event["GeoLoc_ASNGeoSrc.Longitude"] = "1.0"
+        # Extended in place, the same as a re-built resolver
+        self.assertIs(event._resolver[2], names)
+        self.assertEqual(event["msg"], "alert message")
+        self.assertEqual(event["Longitude"], "1.0")
+        rebuilt = Event(adict=dict(event.data))
+        self.assertEqual(event._resolver[2], rebuilt._build_resolver())
+
     def test_manager(self):
         events = EventManager(alist=T.TEST_EVENTS)
         print("get_text(fields=['SrcIP', 'DstIP', 'LastTime'])")
@@ -111,3 +153,13 @@ class T(unittest.TestCase):
                 ]
             ),
         )
+
+    def test_fields_maps(self):
+        for internal, nickname in Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME.items():
+            self.assertEqual(
+                Event.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME[nickname], internal
+            )
+        for nickname, internal in Event.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME.items():
+            if nickname not in Event.SIEM_FIELDS_MAP_INTERNAL_NAME_TO_NICKNAME.values():
+                self.assertEqual(nickname, internal)
+        self.assertEqual(len(Event.SIEM_FIELDS_MAP_NICKNAME_TO_INTERNAL_NAME), 299)